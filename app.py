@@ -1,22 +1,34 @@
 import os
-import io
-import json
+import atexit
+import copy
+import functools
+import hashlib
 import uuid
 import threading
 import time
-import tempfile
-import pickle
+import msgspec
+import orjson
+import redis
 import requests
 import re
+import unicodedata
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from werkzeug.middleware.proxy_fix import ProxyFix
-import glob
 
 # Setup environment first before any other imports
 from utils.env_setup import setup_environment
 logger = setup_environment()
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_file, flash
+from flask import Flask, Response, render_template, request, jsonify, session, redirect, url_for, flash
 from flask_session import Session  # <-- Add this import
+from flask.json.provider import DefaultJSONProvider
+from flask.sessions import SessionInterface
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -29,6 +41,18 @@ except ImportError:
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     DEEPL_API_KEY = os.getenv('DEEPL_API_KEY')
 
+from utils.swagger_utils import extract_swagger_info, format_endpoint_details, is_likely_json_url
+from utils.web_utils import extract_web_content
+from utils.i14y_utils import get_agents
+from utils.json_utils import generate_dcat_json
+from utils.openai_utils import generate_api_description
+
+# DeepL is optional - without it the review step starts with empty translations
+try:
+    from utils.deepl_utils import translate_to_language
+except ImportError:
+    translate_to_language = None
+
 # Log key presence (not the actual values)
 logger.info(f"OPENAI_API_KEY available: {bool(OPENAI_API_KEY)}")
 logger.info(f"DEEPL_API_KEY available: {bool(DEEPL_API_KEY)}")
@@ -39,46 +63,72 @@ app = Flask(__name__,
             template_folder='templates'
            )
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that uses orjson for jsonify() and request.get_json()"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonProvider(app)
+
 # Session cleanup utility
 def cleanup_old_sessions(session_dir, max_age_seconds=7200):
     """
     Delete session files older than max_age_seconds from the session directory.
     """
-    now = time.time()
-    session_files = glob.glob(os.path.join(session_dir, '*'))
+    cutoff = time.time() - max_age_seconds
     deleted = 0
-    for f in session_files:
-        try:
-            if os.path.isfile(f):
-                mtime = os.path.getmtime(f)
-                if now - mtime > max_age_seconds:
-                    os.remove(f)
+    # scandir entries carry the file type and cache their stat result,
+    # so each file costs a single stat instead of isfile + getmtime
+    with os.scandir(session_dir) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
                     deleted += 1
-        except Exception as e:
-            logger.warning(f"Could not delete session file {f}: {e}")
+            except Exception as e:
+                logger.warning(f"Could not delete session file {entry.path}: {e}")
     if deleted > 0:
         logger.info(f"Deleted {deleted} expired session files from {session_dir}")
 
+# Optional Redis for sessions and shared caches (expiry handled by key TTLs)
+redis_url = os.environ.get('REDIS_URL')
+redis_client = redis.Redis.from_url(redis_url) if redis_url else None
+
 # Configure server-side session storage
-session_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'session_storage')
-os.makedirs(session_dir, exist_ok=True)
+SESSION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'session_storage')
+os.makedirs(SESSION_DIR, exist_ok=True)
 
 # Clean up old sessions before initializing session interface
-cleanup_old_sessions(session_dir, max_age_seconds=7200)
+# (only the filesystem backend leaves files behind; Redis sessions expire on their own)
+if redis_client is None:
+    cleanup_old_sessions(SESSION_DIR, max_age_seconds=7200)
 
 # Ensure permissions are set correctly for Docker environment
+# (WARNING: 0o777 makes the directory world-writable. Only use this in isolated Docker
+# containers, never on shared or production hosts, as it poses a security risk.)
+if os.environ.get('DOCKERIZED', '').lower() == 'true':
+    session_dir_mode = 0o777  # Relaxed permissions for Docker
+else:
+    session_dir_mode = 0o770  # Restrict to owner/group
 try:
-    os.chmod(session_dir, 0o777)  # Make writable by all users (needed for Docker; WARNING: 0o777 makes the directory world-writable. Only use this in isolated Docker containers, never on shared or production hosts, as it poses a security risk.)
-    if os.environ.get('DOCKERIZED', '').lower() == 'true':
-        os.chmod(session_dir, 0o777)  # Relaxed permissions for Docker
-    else:
-        os.chmod(session_dir, 0o770)  # Restrict to owner/group
+    # Only chmod when needed - every worker runs this at import time
+    if os.stat(SESSION_DIR).st_mode & 0o777 != session_dir_mode:
+        os.chmod(SESSION_DIR, session_dir_mode)
 except Exception as e:
     logger.warning(f"Could not set permissions on session directory: {e}")
 
-# Configure session
-app.config['SESSION_TYPE'] = 'filesystem'
-app.config['SESSION_FILE_DIR'] = session_dir
+# Configure session - use Redis when REDIS_URL is set (shared across workers),
+# otherwise fall back to the session_storage directory
+if redis_client is not None:
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis_client
+    logger.info("Using Redis session backend")
+else:
+    app.config['SESSION_TYPE'] = 'filesystem'
+    app.config['SESSION_FILE_DIR'] = SESSION_DIR
 app.config['SESSION_PERMANENT'] = False
 app.config['SESSION_USE_SIGNER'] = False  # Disable signer to avoid bytes/string issues
 app.config['SESSION_KEY_PREFIX'] = ''
@@ -90,6 +140,25 @@ app.config['SESSION_COOKIE_SECURE'] = os.environ.get('HTTPS_ENABLED', '').lower(
 # Initialize Flask-Session
 Session(app)
 
+class StaticRequestFilteringSessionInterface(SessionInterface):
+    """Session interface that skips the session backend for static file requests"""
+    def __init__(self, app, session_interface):
+        self.static_prefix = app.static_url_path + '/'
+        self.session_interface = session_interface
+
+    def open_session(self, app, request):
+        if request.path.startswith(self.static_prefix):
+            return self.make_null_session(app)
+        return self.session_interface.open_session(app, request)
+
+    def save_session(self, app, session, response):
+        if self.is_null_session(session):
+            return None
+        return self.session_interface.save_session(app, session, response)
+
+# Static assets never use the session, so don't load or rewrite it for them
+app.session_interface = StaticRequestFilteringSessionInterface(app, app.session_interface)
+
 # Apply ProxyFix for correct proxy handling (important for Digital Ocean)
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1, x_prefix=1)
 
@@ -102,11 +171,79 @@ if not secret_key:
     secret_key = 'swagger2dcat-secret-key'
 app.secret_key = secret_key
 
-# Create session directory
-os.makedirs(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'session_storage'), exist_ok=True)
-
 # Global dictionary to store processing results (in production, you'd use Redis or similar)
+# NOTE: single source of truth - do not re-initialize further down
 processing_results = {}
+# Guard mutations of processing_results entries shared between request and worker
+# threads; entries are sharded over several locks so concurrent workflows don't contend
+PROCESSING_LOCK_SHARDS = 16
+processing_locks = [threading.Lock() for _ in range(PROCESSING_LOCK_SHARDS)]
+
+def get_processing_lock(proc_id):
+    """Return the lock guarding the processing_results entry of proc_id"""
+    return processing_locks[hash(proc_id) % PROCESSING_LOCK_SHARDS]
+
+# Bounded pool running the background workflows started from /url
+workflow_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('WORKFLOW_WORKERS', '8')),
+    thread_name_prefix='swagger2dcat'
+)
+atexit.register(workflow_executor.shutdown, wait=False)
+
+# Separate pool for the fetches a workflow runs alongside its Swagger parsing; sharing
+# workflow_executor could deadlock once every worker waits on a queued fetch
+fetch_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='swagger2dcat-fetch')
+atexit.register(fetch_executor.shutdown, wait=False)
+
+# Maximum number of landing page characters used in the API description
+LANDING_PAGE_EXCERPT_LENGTH = 3000
+
+# Seconds a status poll waits for the background thread to report progress. Every waiting
+# poll holds a server thread (see --threads in the Dockerfile), so keep this short enough
+# that open loading pages cannot starve other requests
+STATUS_LONG_POLL_TIMEOUT = 3
+
+# Entries nobody polled to completion (closed tab, abandoned workflow) are dropped after this
+PROCESSING_RESULT_TTL = 2 * 60 * 60  # 2 hours
+
+def prune_processing_results():
+    """Drop processing_results entries older than PROCESSING_RESULT_TTL"""
+    cutoff = time.time() - PROCESSING_RESULT_TTL
+    for proc_id, result in list(processing_results.items()):
+        if result.get('created_at', 0) < cutoff:
+            with get_processing_lock(proc_id):
+                processing_results.pop(proc_id, None)
+
+# Progress changes smaller than this (in percent) are not published to the status poll
+PROGRESS_MIN_STEP = 5
+
+def update_processing_results(proc_id, **changes):
+    """
+    Apply changes to the processing_results entry of proc_id and wake up a waiting status poll.
+    
+    The entry is replaced rather than mutated, so a reader always sees a consistent
+    snapshot (e.g. status 'complete' together with its data).
+    """
+    with get_processing_lock(proc_id):
+        result = processing_results.get(proc_id)
+        if result is None:
+            return
+        processing_results[proc_id] = {**result, **changes}
+    result['event'].set()
+
+def update_processing_progress(proc_id, current_step, percent, steps_completed):
+    """Record the progress of a workflow and wake up a waiting status poll"""
+    result = processing_results.get(proc_id)
+    if result is None:
+        return
+    if percent - result.get('progress', {}).get('percent', 0) < PROGRESS_MIN_STEP:
+        return
+    update_processing_results(proc_id, progress={
+        'current_step': current_step,
+        'percent': percent,
+        'steps_completed': steps_completed,
+        'total_steps': 3
+    })
 
 # Global cache for agents to avoid repeated API calls
 agents_cache = {
@@ -114,118 +251,428 @@ agents_cache = {
     'timestamp': None,
     'cache_duration': 3600  # 1 hour
 }
-
-def get_cached_agents():
-    """Get agents from cache or fetch if cache is expired"""
-    current_time = time.time()
-    
-    # Check if cache is valid
-    if (agents_cache['data'] is not None and 
-        agents_cache['timestamp'] is not None and 
-        current_time - agents_cache['timestamp'] < agents_cache['cache_duration']):
-        return agents_cache['data']
+# Serializes agents refreshes so a cache miss triggers a single upstream fetch
+agents_lock = threading.Lock()
+
+# Redis keys for the shared agents cache (used when REDIS_URL is set)
+# v2: values are zlib-compressed msgpack
+AGENTS_REDIS_KEY = 'swagger2dcat:agents:v2'
+AGENTS_STALE_REDIS_KEY = 'swagger2dcat:agents:stale:v2'
+AGENTS_STALE_DURATION = 24 * 60 * 60  # 24 hours
+
+def _encode_agents(agents):
+    """Encode the agents list for Redis; the repetitive multilingual names compress well even at level 1"""
+    return zlib.compress(msgspec.msgpack.encode(agents), 1)
+
+# Last (raw, agents) pair read from Redis - the value only changes when the cache is refreshed,
+# so the list keeps its identity across requests (and get_agents_by_id stays valid)
+agents_decode_memo = {'last': (None, None)}
+
+def _decode_agents(raw):
+    """Decode an agents list written by _encode_agents, reusing the previous result for unchanged bytes"""
+    last_raw, last_agents = agents_decode_memo['last']
+    if raw == last_raw:
+        return last_agents
+    agents = msgspec.msgpack.decode(zlib.decompress(raw))
+    agents_decode_memo['last'] = (raw, agents)
+    return agents
+
+def _get_redis_cached_agents():
+    """Get agents from the Redis cache shared by all workers, fetching them on a miss"""
+    try:
+        raw = redis_client.get(AGENTS_REDIS_KEY)
+        if raw:
+            return _decode_agents(raw)
+    except redis.RedisError as e:
+        logger.warning(f"Could not read agents from Redis: {str(e)}")
+    
+    with agents_lock:
+        return _refresh_redis_cached_agents()
+
+def _refresh_redis_cached_agents():
+    """Fetch agents into Redis on a miss (called with agents_lock held)"""
+    # Another thread may have refreshed the key while we waited for the lock
+    try:
+        raw = redis_client.get(AGENTS_REDIS_KEY)
+        if raw:
+            return _decode_agents(raw)
+    except redis.RedisError as e:
+        logger.warning(f"Could not read agents from Redis: {str(e)}")
     
-    # Fetch fresh data
     try:
-        from utils.i14y_utils import get_agents
-        # Get agents without fetching details by default for better performance
         agents = get_agents(fetch_details=False)
-        
-        # Update cache
-        agents_cache['data'] = agents
-        agents_cache['timestamp'] = current_time
-        
-        return agents
     except Exception as e:
         logger.error(f"Error fetching agents: {str(e)}")
-        # Return cached data even if expired, or empty list
-        return agents_cache['data'] if agents_cache['data'] is not None else []
-
-def save_processing_data(processing_id, data):
-    """Save processing data to temporary file to avoid session size limits"""
-    # Validate processing_id to prevent path injection
-    import re
-    if not re.match(r'^[a-f0-9-]+$', processing_id):
-        logger.error(f"Invalid processing_id format: rejected for security")
-        return False
-    
-    temp_dir = tempfile.gettempdir()
-    temp_file = os.path.join(temp_dir, f"swagger2dcat_{processing_id}.pkl")
-    
-    # Ensure the file path is within temp directory (prevent path traversal)
-    real_temp_dir = os.path.realpath(temp_dir)
-    real_temp_file = os.path.realpath(temp_file)
-    if not real_temp_file.startswith(real_temp_dir):
-        logger.error("Path traversal attempt detected")
-        return False
+        agents = []
     
     try:
-        with open(temp_file, 'wb') as f:
-            pickle.dump(data, f)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving processing data: {str(e)}")
-        return False
-
-def load_processing_data(processing_id):
-    """Load processing data from temporary file"""
-    # Validate processing_id to prevent path injection
-    import re
-    if not re.match(r'^[a-f0-9-]+$', processing_id):
-        logger.error(f"Invalid processing_id format: rejected for security")
-        return None
+        if agents:
+            # Write the stale copy alongside so an upstream outage doesn't empty the form
+            encoded = _encode_agents(agents)
+            pipe = redis_client.pipeline()
+            pipe.setex(AGENTS_REDIS_KEY, agents_cache['cache_duration'], encoded)
+            pipe.setex(AGENTS_STALE_REDIS_KEY, AGENTS_STALE_DURATION, encoded)
+            pipe.execute()
+            return agents
+        
+        raw = redis_client.get(AGENTS_STALE_REDIS_KEY)
+        return _decode_agents(raw) if raw else []
+    except redis.RedisError as e:
+        logger.warning(f"Could not access agents cache in Redis: {str(e)}")
+        return agents
+
+# {id: agent} index and lower-cased id set of the most recently seen agents list
+agents_index = {'last': (None, {}, frozenset())}
+
+def _index_agents(agents):
+    """Return the (by_id, ids_lower) index of the given agents list, rebuilt only when the list object changes"""
+    last = agents_index['last']
+    if last[0] is not agents:
+        by_id = {agent['id']: agent for agent in agents or [] if agent.get('id')}
+        last = (agents, by_id, frozenset(agent_id.lower() for agent_id in by_id))
+        agents_index['last'] = last
+    return last[1], last[2]
+
+def get_agents_by_id(agents):
+    """Return an {id: agent} map for the given agents list"""
+    return _index_agents(agents)[0]
+
+def get_agent_ids_lower(agents):
+    """Return the set of the ids of the given agents list in lower case"""
+    return _index_agents(agents)[1]
+
+def _agents_cache_is_fresh():
+    """Whether the in-process agents cache holds data younger than its cache_duration"""
+    timestamp = agents_cache['timestamp']
+    return (agents_cache['data'] is not None and
+            timestamp is not None and
+            time.monotonic() - timestamp < agents_cache['cache_duration'])
+
+def get_cached_agents():
+    """Get agents from cache or fetch if cache is expired"""
+    if redis_client is not None:
+        return _get_redis_cached_agents()
     
-    temp_dir = tempfile.gettempdir()
-    # Normalize and secure the file path
-    filename = f"swagger2dcat_{processing_id}.pkl"
-    temp_file = os.path.normpath(os.path.join(temp_dir, filename))
+    # Fast path without the lock while the cache is valid
+    if _agents_cache_is_fresh():
+        return agents_cache['data']
     
-    # Ensure the file path is within temp directory (prevent path traversal)
-    real_temp_dir = os.path.realpath(temp_dir)
-    real_temp_file = os.path.realpath(temp_file)
-    if not real_temp_file.startswith(real_temp_dir + os.sep):
-        logger.error("Path traversal attempt detected")
-        return None
+    # Only one request refreshes the cache; concurrent misses wait and reuse its result
+    with agents_lock:
+        if _agents_cache_is_fresh():
+            return agents_cache['data']
+        
+        # Fetch fresh data
+        try:
+            # Get agents without fetching details by default for better performance
+            agents = get_agents(fetch_details=False)
+            
+            # Update cache
+            agents_cache['data'] = agents
+            agents_cache['timestamp'] = time.monotonic()
+            
+            return agents
+        except Exception as e:
+            logger.error(f"Error fetching agents: {str(e)}")
+            # Return cached data even if expired (timestamp untouched so the next request retries), or empty list
+            return agents_cache['data'] if agents_cache['data'] is not None else []
+
+# Pooled connections to the I14Y APIs (Partner API submissions and Agent lookups)
+# so repeated calls reuse the TLS session
+i14y_http_session = requests.Session()
+i14y_http_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# Per-agency details from the I14Y Agent endpoint: {agency_id: (monotonic timestamp, details)}
+agency_details_cache = {}
+agency_details_lock = threading.Lock()
+AGENCY_DETAILS_CACHE_DURATION = 600  # 10 minutes
+
+def get_cached_agency_details(agency_id):
+    """
+    Get the details of an agency from cache or fetch them if the cache entry is expired.
     
-    # Additional security check: verify filename doesn't contain path separators
-    if os.sep in processing_id or '..' in processing_id:
-        logger.error("Invalid characters in processing_id")
-        return None
+    Returns an empty dict when agency_id is empty or the details cannot be fetched
+    (failures are not cached). The returned dict is shared - do not mutate it.
+    """
+    if not agency_id:
+        return {}
+    
+    entry = agency_details_cache.get(agency_id)
+    if entry is not None and time.monotonic() - entry[0] < AGENCY_DETAILS_CACHE_DURATION:
+        return entry[1]
     
     try:
-        # Use the validated real path for all operations
-        if os.path.exists(real_temp_file):
-            with open(real_temp_file, 'rb') as f:
-                data = pickle.load(f)
-            # Clean up the file after loading
-            os.remove(real_temp_file)
-            return data
+        response = i14y_http_session.get(
+            f"https://input-backend.i14y.c.bfs.admin.ch/api/Agent/{agency_id}",
+            timeout=(3, 5)  # (connect, read)
+        )
+        if response.status_code != 200:
+            logger.warning(f"Could not fetch agency details for {agency_id}: HTTP {response.status_code}")
+            return {}
+        details = response.json()
     except Exception as e:
-        logger.error(f"Error loading processing data: {str(e)}")
-    
-    return None
+        logger.warning(f"Could not fetch agency details for {agency_id}: {e}")
+        return {}
+    
+    with agency_details_lock:
+        agency_details_cache[agency_id] = (time.monotonic(), details)
+    return details
+
+def prefetch_agency_details(agency_id):
+    """Warm the agency details cache in the background so the review page doesn't wait for the fetch"""
+    if not agency_id:
+        return
+    entry = agency_details_cache.get(agency_id)
+    if entry is None or time.monotonic() - entry[0] >= AGENCY_DETAILS_CACHE_DURATION:
+        fetch_executor.submit(get_cached_agency_details, agency_id)
+
+# Matches one comma-separated keyword without its surrounding whitespace
+KEYWORD_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+def split_keywords(keywords_str):
+    """Split a comma-separated keyword string into a list of trimmed, non-empty keywords"""
+    # Untranslated languages usually submit an empty field - skip the regex scan for those
+    return KEYWORD_RE.findall(keywords_str) if keywords_str else []
+
+def translations_from_form(form):
+    """Read the title/description/keywords fields of every language from the review form"""
+    return {
+        lang: {
+            'title': form.get(f'title_{lang}', ''),
+            'description': form.get(f'description_{lang}', ''),
+            'keywords': split_keywords(form.get(f'keywords_{lang}', ''))
+        } for lang in ('en', 'de', 'fr', 'it')
+    }
 
-# Global dictionary to store processing results (in production, you'd use Redis or similar)
-processing_results = {}
+def build_document_links(doc_labels, doc_hrefs):
+    """Rebuild the document links from the parallel label/href lists of the review form"""
+    document_links = []
+    for label, href in zip(doc_labels, doc_hrefs):
+        href = href.strip()
+        if not href:
+            continue
+        # File name is the last path segment, type is its extension (if any)
+        base = href.rsplit('/', 1)[-1]
+        dot = base.rfind('.')
+        doc_type = base[dot + 1:].lower() if dot >= 0 else ''
+        document_links.append({
+            'href': href,
+            'label': label.strip() or base,
+            'type': doc_type
+        })
+    return document_links
+
+# Captures the office abbreviation from URLs like https://bafu.admin.ch/...
+ADMIN_CH_RE = re.compile(r"https?://([a-z0-9\-]+)\.admin\.ch", re.IGNORECASE)
 
-def detect_office_id_from_url(url, agents):
+def detect_office_id_from_url(url, agent_ids_lower):
     """
     Try to detect the office abbreviation from a .admin.ch URL and return the matching agency id (e.g., CH_BAFU)
+    
+    agent_ids_lower is a set of all known agent ids in lower case.
     """
     if not url or "admin.ch" not in url:
         return None
     # Extract subdomain before .admin.ch
-    match = re.search(r"https?://([a-z0-9\-]+)\.admin\.ch", url, re.IGNORECASE)
+    match = ADMIN_CH_RE.search(url)
     if match:
         abbrev = match.group(1)
         if abbrev:
-            # Try both upper and lower case
-            possible_ids = [f"CH_{abbrev.upper()}", f"CH_{abbrev.lower()}"]
-            for pid in possible_ids:
-                if any(agent.get('id', '').lower() == pid.lower() for agent in agents):
-                    return pid
+            if f"ch_{abbrev.lower()}" in agent_ids_lower:
+                return f"CH_{abbrev.upper()}"
     return None
 
+@functools.lru_cache(maxsize=128)
+def build_full_description(description, landing_page_url, landing_page_content, document_links, document_count,
+                           version, additional_info, endpoint_summary, endpoint_details_text):
+    """
+    Assemble the pre-filled API description shown on /ai.
+    
+    All arguments are hashable (document_links holds up to 10 (label, href) pairs and
+    endpoint_details_text is the preformatted text from extract_swagger_info) so the
+    result is cached and back-navigation to /ai doesn't rebuild it.
+    """
+    # Collect the description sections and join them once at the end
+    parts = [description]
+
+    # Add web content to description if available (already cut to LANDING_PAGE_EXCERPT_LENGTH)
+    if landing_page_content:
+        parts.append(f"--- Additional information from {landing_page_url} ---\n\n{landing_page_content}")
+        
+        # Add document links if available
+        if document_links:
+            doc_lines = [f"- {label}: {href}" for label, href in document_links]
+            if document_count > 10:
+                doc_lines.append(f"... and {document_count - 10} more documents")
+            parts.append("--- Document Links ---\n\n" + "\n".join(doc_lines))
+
+    if version:
+        parts.append(f"Version: {version}")
+
+    if additional_info:
+        parts.append(additional_info)
+
+    # Add endpoint summary if available
+    if endpoint_summary:
+        parts.append(f"--- Endpoint Summary ---\n\n{endpoint_summary}")
+
+    # Add endpoint short descriptions if available
+    if endpoint_details_text:
+        parts.append(f"--- Endpoint Details ---\n\n{endpoint_details_text}\n")
+
+    return "\n\n".join(part for part in parts if part)
+
+# Languages of the contact point name (fn); the form fields only cover de/en/fr/it
+CONTACT_POINT_LANGS = ('de', 'en', 'fr', 'it', 'rm')
+
+# Empty contact point in the review form's shape - deep-copy before mutating
+DEFAULT_CONTACT_POINT = {
+    "emailInternet": "",
+    "org": {"de": "", "en": "", "fr": "", "it": ""},
+    "adrWork": {"de": "", "en": "", "fr": "", "it": ""},
+    "note": {"de": "", "en": "", "fr": "", "it": ""},
+    "telWorkVoice": "",
+    "fn": {lang: "" for lang in CONTACT_POINT_LANGS}
+}
+
+# Empty contact point in the I14Y VCard shape - deep-copy before mutating
+DEFAULT_VCARD_CONTACT_POINT = {
+    "fn": {lang: "" for lang in CONTACT_POINT_LANGS},
+    "hasAddress": {lang: "" for lang in CONTACT_POINT_LANGS},
+    "hasEmail": "",
+    "hasTelephone": "",
+    "kind": "Organization",
+    "note": {lang: "" for lang in CONTACT_POINT_LANGS}
+}
+
+# Per-language fields of a contact point and the languages each one carries
+CONTACT_POINT_DICT_FIELDS = (
+    ('fn', CONTACT_POINT_LANGS),
+    ('org', CONTACT_POINT_LANGS[:4]),
+    ('hasAddress', CONTACT_POINT_LANGS),
+    ('adrWork', CONTACT_POINT_LANGS[:4]),
+    ('note', CONTACT_POINT_LANGS)
+)
+
+def ensure_contact_point_fields(contact_point):
+    """Replace any missing or malformed per-language field of contact_point with an empty one"""
+    for field, langs in CONTACT_POINT_DICT_FIELDS:
+        if not isinstance(contact_point.get(field), dict):
+            contact_point[field] = dict.fromkeys(langs, "")
+    return contact_point
+
+# Per-language review form fields and the contact point fields they are saved to
+# (both the I14Y names and the template names, for compatibility)
+CONTACT_POINT_FORM_FIELDS = (
+    ('org', ('fn', 'org')),
+    ('adr', ('hasAddress', 'adrWork')),
+    ('note', ('note',))
+)
+
+def update_contact_point_from_form(contact_point, form):
+    """Copy the contact point fields of the review form into contact_point (see ensure_contact_point_fields)"""
+    for form_key, fields in CONTACT_POINT_FORM_FIELDS:
+        for lang in CONTACT_POINT_LANGS[:4]:
+            value = form.get(f'{form_key}_{lang}', '')
+            for field in fields:
+                contact_point[field][lang] = value
+    # The form has no Romansh fields
+    for field in ('fn', 'hasAddress', 'note'):
+        contact_point[field]['rm'] = ""
+    
+    # Save email and phone to BOTH field names (for template AND JSON/API compatibility)
+    contact_point['hasEmail'] = contact_point['emailInternet'] = form.get('emailInternet', '')
+    contact_point['hasTelephone'] = contact_point['telWorkVoice'] = form.get('telWorkVoice', '')
+    contact_point['kind'] = "Organization"
+    return contact_point
+
+# The Partner API answers a successful submission with the new dataset's UUID
+UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+# User-facing messages for failed submissions (details are only logged)
+I14Y_ERROR_MESSAGES = {
+    400: 'Bad request. Please verify your data format and try again.',
+    401: 'Authentication failed. Please check your access token.',
+    403: 'Access forbidden. You may not have permission to submit data.',
+    422: 'Data validation failed. Please check all required fields and try again.'
+}
+I14Y_DEFAULT_ERROR_MESSAGE = 'API request failed. Please try again later.'
+I14Y_ERROR_TEXT_LIMIT = 512  # Max characters of a non-JSON error body written to the log
+
+# Maps whitespace and characters that are unsafe in a download name to '_'
+DOWNLOAD_FILENAME_TABLE = str.maketrans(dict.fromkeys(' \t\r\n/\\"', '_'))
+
+# Bounded LRU of generated DCAT documents, keyed by a hash of their inputs
+DCAT_CACHE_SIZE = 128
+dcat_cache = OrderedDict()
+dcat_cache_lock = threading.Lock()
+
+def get_cached_dcat_json(translations, theme_codes, agency_id, swagger_url, landing_page_url, agents_list,
+                         access_rights_code, license_code, contact_point_override, document_links):
+    """
+    Same as generate_dcat_json, but reuses the result when the review page, download
+    and submission are rendered again with unchanged inputs.
+    
+    Only the selected agent enters the key (it is all generate_dcat_json reads from
+    agents_list), plus today's date because the document carries it as version.
+    """
+    agent = get_agents_by_id(agents_list).get(agency_id)
+    key_material = [translations, theme_codes, agency_id, swagger_url, landing_page_url, bool(agents_list), agent,
+                    access_rights_code, license_code, contact_point_override, document_links, date.today().isoformat()]
+    key = hashlib.blake2b(orjson.dumps(key_material, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)).hexdigest()
+    
+    with dcat_cache_lock:
+        json_data = dcat_cache.get(key)
+        if json_data is not None:
+            dcat_cache.move_to_end(key)
+            return json_data
+    
+    json_data = generate_dcat_json(
+        translations=translations,
+        theme_codes=theme_codes,
+        agency_id=agency_id,
+        swagger_url=swagger_url,
+        landing_page_url=landing_page_url,
+        # generate_dcat_json only looks up agency_id, so hand it the matching agent alone
+        agents_list=[agent] if agent else agents_list,
+        access_rights_code=access_rights_code,
+        license_code=license_code,
+        contact_point_override=contact_point_override,
+        document_links=document_links
+    )
+    
+    with dcat_cache_lock:
+        dcat_cache[key] = json_data
+        if len(dcat_cache) > DCAT_CACHE_SIZE:
+            dcat_cache.popitem(last=False)
+    return json_data
+
+def build_session_dcat_json():
+    """Generate the DCAT JSON from the current session data (used by download and submission)"""
+    selected_agency = session.get('selected_agency', '')
+    # Use the agency identifier (not GUID) as publisher
+    agency_identifier = get_cached_agency_details(selected_agency).get('identifier', selected_agency)
+    logger.info(f"Using publisher identifier: {agency_identifier} (selected_agency: {selected_agency})")
+    
+    return get_cached_dcat_json(
+        translations=session.get('translations', {}),
+        theme_codes=session.get('theme_codes', []),
+        agency_id=agency_identifier,
+        swagger_url=session.get('swagger_url', ''),
+        landing_page_url=session.get('landing_page_url', ''),
+        agents_list=get_cached_agents(),
+        access_rights_code=session.get('access_rights_code', 'PUBLIC'),
+        license_code=session.get('license_code', ''),
+        # generate_dcat_json reads both the I14Y and the review form field names; without a
+        # reviewed contact point (None) it falls back to the agency's own contact point
+        contact_point_override=session.get('contact_point') or None,
+        document_links=session.get('document_links', [])
+    )
+
 # Then modify routes to use workflow_id parameter instead of session
 @app.route('/')
 def index():
@@ -236,14 +683,50 @@ def index():
 @app.route('/url', methods=['GET', 'POST'])
 def url():
     if request.method == 'POST':
-        # Create new workflow
+        # Create new workflow (and expire abandoned ones)
         workflow_id = str(uuid.uuid4())
+        prune_processing_results()
         
         # Initialize processing results entry
-        processing_results[workflow_id] = {
-            'status': 'processing',
-            'created_at': time.time()
-        }
+        with get_processing_lock(workflow_id):
+            processing_results[workflow_id] = {
+                'status': 'processing',
+                'created_at': time.time(),
+                # Set by the background thread whenever the status or progress changes
+                'event': threading.Event(),
+                'progress': {
+                    'current_step': 'Initializing...',
+                    'percent': 5,
+                    'steps_completed': 0,
+                    'total_steps': 3
+                }
+            }
+        
+        def fetch_landing_page(landing_page_url):
+            """Return the description excerpt, document links and address data of the landing page"""
+            landing_start_time = time.time()
+            # Returns address_data as 5th value
+            web_title, web_description, web_content, doc_links, address_data = extract_web_content(landing_page_url)
+            
+            landing_page_content = ""
+            document_links = []
+            if web_content:
+                # Only the excerpt shown on /ai is kept, so the session never carries the full scrape
+                landing_page_content = (web_description or web_content)[:LANDING_PAGE_EXCERPT_LENGTH]
+                document_links = doc_links
+            
+            landing_time = time.time() - landing_start_time
+            logger.info(f"Landing page processing completed in {landing_time:.2f} seconds")
+            logger.info(f"Extracted {len(document_links)} document links from landing page")
+            return landing_page_content, document_links, address_data
+        
+        def fetch_agents():
+            """Return the list of agents (using cache)"""
+            agents_start_time = time.time()
+            agents = get_cached_agents()
+            agents_time = time.time() - agents_start_time
+            logger.info(f"Agents fetching completed in {agents_time:.2f} seconds")
+            return agents
         
         # Start processing in background
         def process_api_data(proc_id, swagger_url, landing_page_url):
@@ -253,17 +736,16 @@ def url():
                 process_start_time = time.time()
                 
                 # Update progress
-                if proc_id in processing_results:
-                    processing_results[proc_id]['progress'] = {
-                        'current_step': 'Parsing Swagger definition',
-                        'percent': 15,
-                        'steps_completed': 0,
-                        'total_steps': 3
-                    }
+                update_processing_progress(proc_id, 'Parsing Swagger definition', 15, 0)
                 
-                # Step 1: Parse Swagger specification (with URL detection)
-                from utils.swagger_utils import extract_swagger_info, is_likely_json_url
+                # The landing page and the agents do not depend on the Swagger definition,
+                # so they are fetched in parallel while it is parsed in this thread
+                landing_future = None
+                if landing_page_url and landing_page_url.strip():
+                    landing_future = fetch_executor.submit(fetch_landing_page, landing_page_url)
+                agents_future = fetch_executor.submit(fetch_agents)
                 
+                # Step 1: Parse Swagger specification (with URL detection)
                 # Check if direct JSON URL to log that we're skipping detection
                 if is_likely_json_url(swagger_url):
                     logger.info(f"Direct JSON URL detected, skipping URL discovery step: {swagger_url}")
@@ -272,13 +754,7 @@ def url():
                 swagger_time = time.time() - process_start_time
                 
                 # Update progress after swagger parsing
-                if proc_id in processing_results:
-                    processing_results[proc_id]['progress'] = {
-                        'current_step': 'Swagger definition parsed',
-                        'percent': 40,
-                        'steps_completed': 1,
-                        'total_steps': 3
-                    }
+                update_processing_progress(proc_id, 'Swagger definition parsed', 40, 1)
                 
                 # Log performance metrics
                 logger.info(f"Swagger parsing completed in {swagger_time:.2f} seconds")
@@ -297,66 +773,33 @@ def url():
                 address_data = {}
                 
                 # Update progress to landing page step
-                if proc_id in processing_results:
-                    processing_results[proc_id]['progress'] = {
-                        'current_step': 'Processing landing page',
-                        'percent': 50,
-                        'steps_completed': 1,
-                        'total_steps': 3
-                    }
+                update_processing_progress(proc_id, 'Processing landing page', 50, 1)
                 
                 # Skip landing page processing if URL is empty
-                if landing_page_url and landing_page_url.strip():
-                    landing_start_time = time.time()
-                    from utils.web_utils import extract_web_content
-                    # Returns address_data as 5th value
-                    web_title, web_description, web_content, doc_links, address_data = extract_web_content(landing_page_url)
-                    
-                    if web_content:
-                        landing_page_content = web_description or web_content
-                        document_links = doc_links
-                    
-                    landing_time = time.time() - landing_start_time
-                    logger.info(f"Landing page processing completed in {landing_time:.2f} seconds")
-                    logger.info(f"Extracted {len(document_links)} document links from landing page")
+                if landing_future is not None:
+                    landing_page_content, document_links, address_data = landing_future.result()
                 else:
                     logger.info("Skipping landing page processing (no URL provided)")
                 
                 # Update progress after landing page
-                if proc_id in processing_results:
-                    processing_results[proc_id]['progress'] = {
-                        'current_step': 'Loading metadata',
-                        'percent': 75,
-                        'steps_completed': 2,
-                        'total_steps': 3
-                    }
+                update_processing_progress(proc_id, 'Loading metadata', 75, 2)
                 
                 # Step 3: Get the list of agents (using cache)
-                agents_start_time = time.time()
-                agents = get_cached_agents()
+                agents = agents_future.result()
                 agents_error = None if agents else "Failed to fetch agents"
-                agents_time = time.time() - agents_start_time
-                logger.info(f"Agents fetching completed in {agents_time:.2f} seconds")
                 
                 # Calculate total processing time
                 total_time = time.time() - process_start_time
                 logger.info(f"Total processing completed in {total_time:.2f} seconds")
                 
                 # Update progress to 99% (final steps)
-                if proc_id in processing_results:
-                    processing_results[proc_id]['progress'] = {
-                        'current_step': 'Finalizing',
-                        'percent': 99,
-                        'steps_completed': 3,
-                        'total_steps': 3
-                    }
+                update_processing_progress(proc_id, 'Finalizing', 99, 3)
                 
-                # Save processing data to temporary file
+                # Hand the results over in memory - the status poll runs in this same process
                 processing_data = {
                     'swagger_info': swagger_info,
                     'landing_page_content': landing_page_content,
                     'document_links': document_links,
-                    'agents': agents,
                     'agents_error': agents_error,
                     'address_data': address_data,
                     'swagger_url': swagger_url,
@@ -369,48 +812,52 @@ def url():
                     }
                 }
                 
-                if save_processing_data(proc_id, processing_data):
-                    # Mark processing as complete
-                    if proc_id in processing_results:
-                        processing_results[proc_id]['status'] = 'complete'
-                        logger.info(f"Processing completed for {proc_id}")
-                else:
-                    if proc_id in processing_results:
-                        processing_results[proc_id]['status'] = 'error'
-                        processing_results[proc_id]['error'] = "Failed to save processing data"
-                        logger.error(f"Failed to save processing data for {proc_id}")
+                # Mark processing as complete
+                update_processing_results(proc_id, data=processing_data, status='complete')
+                logger.info(f"Processing completed for {proc_id}")
                 
             except Exception as e:
                 logger.error(f"Exception in background processing for {proc_id}: {str(e)}")
                 logger.error("Background processing error", exc_info=True)
-                if proc_id in processing_results:
-                    processing_results[proc_id]['status'] = 'error'
-                    processing_results[proc_id]['error'] = 'An error occurred while processing your request. Please try again.'
-                else:
-                    # Create entry if it doesn't exist
-                    processing_results[proc_id] = {
-                        'status': 'error',
-                        'error': 'An error occurred while processing your request. Please try again.'
-                    }
-        
-        # Initialize progress tracking
-        processing_results[workflow_id]['progress'] = {
-            'current_step': 'Initializing...',
-            'percent': 5,
-            'steps_completed': 0,
-            'total_steps': 3
-        }
+                error_msg = 'An error occurred while processing your request. Please try again.'
+                with get_processing_lock(proc_id):
+                    if proc_id not in processing_results:
+                        # Create entry if it doesn't exist
+                        processing_results[proc_id] = {
+                            'status': 'error',
+                            'error': error_msg,
+                            'created_at': time.time(),
+                            'event': threading.Event(),
+                            'progress': {
+                                'current_step': 'Error',
+                                'percent': 0,
+                                'steps_completed': 0,
+                                'total_steps': 3
+                            }
+                        }
+                        return
+                update_processing_results(proc_id, status='error', error=error_msg)
         
-        # Start the background thread
-        thread = threading.Thread(target=process_api_data, args=(workflow_id, request.form.get('swagger_url', ''), request.form.get('landing_page_url', '')))
-        thread.daemon = True
-        thread.start()
+        # Start processing on the background pool
+        form = request.form
+        future = workflow_executor.submit(process_api_data, workflow_id, form.get('swagger_url', ''), form.get('landing_page_url', ''))
+        # Kept so the status poll can tell a workflow that died without reporting back
+        with get_processing_lock(workflow_id):
+            if workflow_id in processing_results:
+                processing_results[workflow_id] = {**processing_results[workflow_id], 'future': future}
         
         # Redirect to loading page
         return redirect(url_for('loading', workflow_id=workflow_id))
     else:
-        # Start new workflow
-        return render_template('url.html')
+        # Surface errors forwarded by the loading page (/url?error=...)
+        error_message = request.args.get('error')
+        if error_message:
+            flash(error_message, "danger")
+        
+        # Prefill the form with the URLs of the previous run, if any
+        return render_template('url.html',
+                              swagger_url=session.get('swagger_url', ''),
+                              landing_page_url=session.get('landing_page_url', ''))
 
 @app.route('/loading')
 def loading():
@@ -430,8 +877,8 @@ def check_processing_status():
     processing_id = request.args.get('processing_id') or session.get('processing_id')
     
     # Log for debugging
-    logger.info(f"Checking status for processing_id: {processing_id}")
-    logger.info(f"Available processing_results keys: {list(processing_results.keys())}")
+    logger.debug(f"Checking status for processing_id: {processing_id}")
+    logger.debug("Available processing_results keys: %s", processing_results.keys())
     
     if not processing_id:
         logger.warning("No processing_id found in request or session")
@@ -441,11 +888,33 @@ def check_processing_status():
     session['processing_id'] = processing_id
     
     # Check if processing result exists
-    if processing_id in processing_results:
-        result = processing_results[processing_id]
+    result = processing_results.get(processing_id)
+    if result is not None:
+        
+        # Long-poll: while still processing, wait until the background thread reports
+        # progress or finishes instead of answering every poll immediately
+        event = result.get('event')
+        if result.get('status', 'processing') == 'processing' and event is not None:
+            if event.wait(timeout=STATUS_LONG_POLL_TIMEOUT):
+                event.clear()
+            # Entries are replaced on update - read the current snapshot
+            result = processing_results.get(processing_id, result)
+        
         status = result.get('status', 'processing')
         
-        logger.info(f"Processing status for {processing_id}: {status}")
+        # The workflow catches its own errors, so a finished future still 'processing' means it died
+        future = result.get('future')
+        if status == 'processing' and future is not None and future.done():
+            # Re-read first, the workflow may have finished right after the snapshot above
+            result = processing_results.get(processing_id, result)
+            status = result.get('status', 'processing')
+        if status == 'processing' and future is not None and future.done():
+            exc = future.exception()
+            logger.error(f"Workflow {processing_id} ended without reporting a result: {exc}")
+            status = 'error'
+            result = {**result, 'error': 'An error occurred while processing your request. Please try again.'}
+        
+        logger.debug(f"Processing status for {processing_id}: {status}")
         
         # If processing, include any progress information
         if status == 'processing':
@@ -454,7 +923,7 @@ def check_processing_status():
             step = progress.get('current_step', 'Analyzing API information')
             percent = progress.get('percent', 25)  # Default progress value
             
-            return jsonify({
+            response = jsonify({
                 'status': 'processing',
                 'progress': {
                     'step': step,
@@ -462,10 +931,14 @@ def check_processing_status():
                     'message': f"Processing: {step}"
                 }
             })
+            # Let the browser revalidate unchanged progress with a bodyless 304
+            response.set_etag(f"{processing_id}-{percent}")
+            response.headers['Cache-Control'] = 'no-cache'
+            return response.make_conditional(request)
         
-        # If complete, load and store the results
+        # If complete, store the results handed over by the background thread
         elif status == 'complete':
-            processing_data = load_processing_data(processing_id)
+            processing_data = result.get('data')
             
             if processing_data:
                 logger.info(f"Processing data loaded for {processing_id}")
@@ -474,36 +947,28 @@ def check_processing_status():
                 session.permanent = True
                 
                 # Store essential data in session
-                session['swagger_info'] = processing_data.get('swagger_info', {})
-                session['landing_page_content'] = processing_data.get('landing_page_content', '')
-                session['document_links'] = processing_data.get('document_links', [])
-                session['processing_status'] = 'complete'
-                session['swagger_url'] = processing_data.get('swagger_url', '')
-                session['landing_page_url'] = processing_data.get('landing_page_url', '')
-                
-                # Store processing metrics if available
-                if 'processing_metrics' in processing_data:
-                    session['processing_metrics'] = processing_data['processing_metrics']
-                
-                logger.info(f"URLs stored in session - swagger: {session['swagger_url']}, landing: {session['landing_page_url']}")
-                logger.info(f"Session data set - keys: {list(session.keys())}")
+                to_set = {
+                    'swagger_info': processing_data.get('swagger_info', {}),
+                    'landing_page_content': processing_data.get('landing_page_content', ''),
+                    'document_links': processing_data.get('document_links', []),
+                    'processing_status': 'complete',
+                    'swagger_url': processing_data.get('swagger_url', ''),
+                    'landing_page_url': processing_data.get('landing_page_url', '')
+                }
                 
-                # Store address data if available
-                if 'address_data' in processing_data:
-                    session['address_data'] = processing_data['address_data']
+                # Store processing metrics, address data and agents error if available
+                for key in ('processing_metrics', 'address_data', 'agents_error'):
+                    if key in processing_data:
+                        to_set[key] = processing_data[key]
                 
-                # Handle agents separately due to potential size
-                if 'agents' in processing_data:
-                    agents_temp_id = str(uuid.uuid4())
-                    save_processing_data(agents_temp_id, {'agents': processing_data['agents']})
-                    session['agents_temp_id'] = agents_temp_id
+                session.update(to_set)
                 
-                # Store agents error if applicable
-                if 'agents_error' in processing_data:
-                    session['agents_error'] = processing_data['agents_error']
+                logger.info(f"URLs stored in session - swagger: {to_set['swagger_url']}, landing: {to_set['landing_page_url']}")
+                logger.debug("Session data set - keys: %s", session.keys())
                 
                 # Clean up
-                del processing_results[processing_id]
+                with get_processing_lock(processing_id):
+                    processing_results.pop(processing_id, None)
                 
                 return jsonify({'status': 'complete'})
             else:
@@ -518,7 +983,8 @@ def check_processing_status():
             session['processing_error'] = error_msg
             
             # Clean up
-            del processing_results[processing_id]
+            with get_processing_lock(processing_id):
+                processing_results.pop(processing_id, None)
             
             return jsonify({'status': 'error', 'message': error_msg})
     
@@ -532,7 +998,7 @@ def check_processing_status():
 @app.route('/ai')
 def ai():
     # Debug: Log session data
-    logger.info(f"[/ai] Session keys: {list(session.keys())}")
+    logger.debug("[/ai] Session keys: %s", session.keys())
     logger.info(f"[/ai] swagger_url in session: {'swagger_url' in session}")
     logger.info(f"[/ai] processing_status: {session.get('processing_status')}")
     
@@ -547,12 +1013,6 @@ def ai():
         logger.warning(f"[/ai] processing_status is '{session.get('processing_status')}', redirecting to /loading")
         return redirect(url_for('loading'))
     
-    # Import session utilities for file-based storage
-    from utils.session_utils import save_to_session_file, load_from_session_file, restore_all_data_from_files
-    
-    # Restore all data from persistent storage for Docker reliability
-    restore_all_data_from_files()
-    
     # Get data from session
     swagger_url = session.get('swagger_url', '')
     landing_page_url = session.get('landing_page_url', '')
@@ -579,43 +1039,22 @@ def ai():
     landing_page_content = session.get('landing_page_content', '')
     document_links = session.get('document_links', [])
 
-    # Prepare description with additional information
-    full_description = swagger_info.get('description', '')
-    additional_info = swagger_info.get('additional_info', '')
-    version = swagger_info.get('version', '')
-    endpoint_summary = swagger_info.get('endpoint_summary', '')
-    endpoint_short_descriptions = swagger_info.get('endpoint_short_descriptions', [])
-
-    # Add web content to description if available (up to 3000 chars)
-    if landing_page_content:
-        web_content_excerpt = landing_page_content[:3000]  # Use up to 3000 characters
-        full_description += f"\n\n--- Additional information from {landing_page_url} ---\n\n{web_content_excerpt}"
-        
-        # Add document links if available
-        if document_links:
-            full_description += "\n\n--- Document Links ---\n"
-            for doc in document_links[:10]:  # Limit to first 10 documents
-                full_description += f"\n- {doc['label']}: {doc['href']}"
-            if len(document_links) > 10:
-                full_description += f"\n... and {len(document_links) - 10} more documents"
-
-    if version:
-        full_description += f"\n\nVersion: {version}"
-
-    if additional_info:
-        full_description += f"\n\n{additional_info}"
-
-    # Add endpoint summary if available
-    if endpoint_summary:
-        full_description += f"\n\n--- Endpoint Summary ---\n\n{endpoint_summary}"
-
-    # Add endpoint short descriptions if available
-    if endpoint_short_descriptions:
-        full_description += "\n\n--- Endpoint Details ---\n\n"
-        for ep in endpoint_short_descriptions[:30]:
-            full_description += f"{ep['method']} {ep['path']}: {ep['short_description']}\n"
-        if len(endpoint_short_descriptions) > 30:
-            full_description += f"... and {len(endpoint_short_descriptions) - 30} more endpoints\n"
+    # Prepare description with additional information (memoized across renders)
+    endpoint_details_text = swagger_info.get('endpoint_details_text')
+    if endpoint_details_text is None:
+        # Sessions created before the text was precomputed only hold the list
+        endpoint_details_text = format_endpoint_details(swagger_info.get('endpoint_short_descriptions', []))
+    full_description = build_full_description(
+        swagger_info.get('description', ''),
+        landing_page_url,
+        landing_page_content,
+        tuple((doc['label'], doc['href']) for doc in document_links[:10]),
+        len(document_links),
+        swagger_info.get('version', ''),
+        swagger_info.get('additional_info', ''),
+        swagger_info.get('endpoint_summary', ''),
+        endpoint_details_text
+    )
 
     # Get any previously entered or generated content (prioritize API details, then generated, then swagger)
     title = session.get('title') or session.get('generated_title', '') or swagger_info.get('title', '')
@@ -637,17 +1076,8 @@ def ai():
         if theme_code:
             theme_codes = [theme_code]
     
-    # Load agents from temporary storage
-    agents = []
-    agents_temp_id = session.get('agents_temp_id')
-    if agents_temp_id:
-        agents_data = load_processing_data(agents_temp_id)
-        if agents_data and 'agents' in agents_data:
-            agents = agents_data['agents']
-    
-    # Fallback to cached agents if temp data not available
-    if not agents:
-        agents = get_cached_agents()
+    # Load agents from the shared cache (Redis when configured, warmed by the background worker)
+    agents = get_cached_agents()
     
     if not agents and 'agents_error' in session:
         flash("Failed to load publishers: " + session['agents_error'], "danger")
@@ -658,15 +1088,19 @@ def ai():
     # --- Office detection logic ---
     if not selected_agency:
         detected_agency = None
+        agent_ids_lower = get_agent_ids_lower(agents)
         # Try swagger_url first, then landing_page_url
         for url in [session.get('swagger_url', ''), session.get('landing_page_url', '')]:
-            detected_agency = detect_office_id_from_url(url, agents)
+            detected_agency = detect_office_id_from_url(url, agent_ids_lower)
             if detected_agency:
                 break
         if detected_agency:
             selected_agency = detected_agency
             session['selected_agency'] = selected_agency
     
+    # The review page needs the agency details - fetch them while the user fills in this form
+    prefetch_agency_details(selected_agency)
+    
     # Get access rights (default to PUBLIC)
     access_rights_code = session.get('access_rights_code', 'PUBLIC')
     
@@ -707,8 +1141,6 @@ def ai():
 
 @app.route('/generate', methods=['POST'])
 def generate():
-    from utils.session_utils import save_to_session_file
-    
     swagger_url = session.get('swagger_url')
     landing_page_url = session.get('landing_page_url')
     landing_page_content = session.get('landing_page_content', '')
@@ -716,9 +1148,6 @@ def generate():
     if not swagger_url:
         return jsonify({"error": "No swagger URL provided. Please go back to step 1."})
 
-    # Import generate function from utils
-    from utils.openai_utils import generate_api_description
-
     # Call OpenAI to generate the API description
     try:
         generated_content = generate_api_description(
@@ -735,47 +1164,28 @@ def generate():
     if "error" in generated_content:
         return jsonify(generated_content)
 
-    session['generated_title'] = generated_content.get('title', '')
-    session['generated_description'] = generated_content.get('description', '')
-    session['generated_keywords'] = generated_content.get('keywords', [])
-    
     # Handle multiple theme codes - store either as a list or convert single code to list
     theme_codes = generated_content.get('theme_codes', [])
     # For backward compatibility, also check for single theme_code
     if not theme_codes and 'theme_code' in generated_content:
         theme_codes = [generated_content['theme_code']]
     
-    session['theme_codes'] = theme_codes
-
-    # IMPORTANT: Save generated content to persistent storage for Docker reliability
-    generated_data = {
-        'generated_title': session['generated_title'],
-        'generated_description': session['generated_description'],
-        'generated_keywords': session['generated_keywords'],
-        'theme_codes': session['theme_codes']
-    }
-    save_to_session_file('generated_content', generated_data)
-    logger.info("Saved generated content to persistent storage")
+    session.update({
+        'generated_title': generated_content.get('title', ''),
+        'generated_description': generated_content.get('description', ''),
+        'generated_keywords': generated_content.get('keywords', []),
+        'theme_codes': theme_codes
+    })
 
     return jsonify(generated_content)
 
-@app.route('/upload', methods=['GET'])
+@app.route('/upload', methods=['GET', 'POST'])
 def upload():
     # Check if we have the basic data in the session
     if 'swagger_url' not in session:
         flash("Please start from step 1.", "warning")
         return redirect(url_for('url'))
     
-    # Import our session utilities
-    from utils.session_utils import save_to_session_file, load_from_session_file, restore_all_data_from_files
-    from utils.i14y_utils import get_agents
-
-    # Restore all data from persistent storage for Docker reliability
-    restore_all_data_from_files()
-    
-    # Get restored API details for fallback values
-    api_details = load_from_session_file('api_details', {})
-    
     # Get agents for publisher name resolution
     agents = get_cached_agents()
     theme_codes = session.get('theme_codes', [])
@@ -786,47 +1196,22 @@ def upload():
     landing_page_url = session.get('landing_page_url', '')
     document_links = session.get('document_links', [])
 
-    # Always try to load translations from file first with enhanced logging
-    logger.info(f"[/upload] Session ID: {session.get('_id', 'NO_ID')}")
-    logger.info("[/upload] Attempting to load translations from file...")
-    translations = load_from_session_file('translations', {})
-    logger.info(f"[/upload] File load result: {bool(translations)} ({len(translations) if translations else 0} languages)")
-    
-    # Log what we found in the file
-    if translations:
-        for lang, content in translations.items():
-            title = content.get('title', '') if isinstance(content, dict) else ''
-            logger.info(f"[/upload] File {lang}: title='{title[:30]}...' ({len(title)} chars)")
-    
-    # If file didn't have good data, check session
-    if not translations or not any(
-        isinstance(lang_data, dict) and (lang_data.get('title') or lang_data.get('description'))
-        for lang_data in translations.values()
-    ):
-        logger.info("[/upload] File load failed or empty, checking session...")
-        session_translations = session.get('translations', {})
-        logger.info(f"[/upload] Session load result: {bool(session_translations)} ({len(session_translations) if session_translations else 0} languages)")
-        
-        # Use session data if it's better than file data
-        if session_translations and any(
-            isinstance(lang_data, dict) and (lang_data.get('title') or lang_data.get('description'))
-            for lang_data in session_translations.values()
-        ):
-            translations = session_translations
-            logger.info("[/upload] Using session translations (better than file)")
+    # Translations live in the server-side session
+    translations = session.get('translations', {})
+    logger.debug("[/upload] Session translations: %s (%d languages)", bool(translations), len(translations) if translations else 0)
     
-    # If still not found, fallback to API details or generated content
+    # If not found, fallback to API details or generated content
     if not translations or not any(
         isinstance(lang_data, dict) and (lang_data.get('title') or lang_data.get('description'))
         for lang_data in translations.values()
     ):
         logger.info("[/upload] No good translations found, attempting to create from API details...")
         # Try to get from API details or generated content
-        title = session.get('title') or session.get('generated_title', '') or api_details.get('title', '')
-        description = session.get('description') or session.get('generated_description', '') or api_details.get('description', '')
-        keywords = session.get('keywords') or session.get('generated_keywords', []) or api_details.get('keywords', [])
+        title = session.get('title') or session.get('generated_title', '')
+        description = session.get('description') or session.get('generated_description', '')
+        keywords = session.get('keywords') or session.get('generated_keywords', [])
         
-        logger.info(f"[/upload] Fallback data: title='{title[:50] if title else 'NONE'}...', desc_len={len(description) if description else 0}")
+        logger.info("[/upload] Fallback data: title='%.50s...', desc_len=%d", title or 'NONE', len(description) if description else 0)
         
         if title or description:
             translations = {
@@ -839,7 +1224,7 @@ def upload():
                 'fr': {'title': '', 'description': '', 'keywords': []},
                 'it': {'title': '', 'description': '', 'keywords': []}
             }
-            save_to_session_file('translations', translations)
+            session['translations'] = translations
             session['translations_available'] = True
             logger.info("Created fallback translations structure")
         else:
@@ -847,82 +1232,45 @@ def upload():
             flash("Please complete the API details step first.", "warning")
             return redirect(url_for('ai'))
     
-    # Ensure session is always updated with the current translations
-    session['translations'] = translations
+    # The translations came from the session or were just stored there
     session['translations_available'] = True
     
-    logger.info(f"[/upload] Translations loaded successfully")
+    logger.debug("[/upload] Translations loaded successfully")
     
-    # Initialize default contact point structure if missing
-    default_contact_point = {
-        "fn": {"de": "", "en": "", "fr": "", "it": "", "rm": ""},
-        "hasAddress": {"de": "", "en": "", "fr": "", "it": "", "rm": ""},
-        "hasEmail": "",
-        "hasTelephone": "",
-        "kind": "Organization",
-        "note": {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-    }
-    
-    # Backward compatibility for template - provide 'org' and 'adrWork' for templates
-    template_contact_point = {
-        "org": {"de": "", "en": "", "fr": "", "it": ""},
-        "adrWork": {"de": "", "en": "", "fr": "", "it": ""},
-        "emailInternet": "",
-        "telWorkVoice": "",
-        "note": {"de": "", "en": "", "fr": "", "it": ""}
-    }
-
     # Load address_data from session if available (set in check_processing_status)
     address_data = session.get('address_data', {})
     
     # Fetch detailed agency information if we have a selected agency
     agency_details = {}
     if selected_agency:
-        logger.info(f"[/upload] Fetching details for agency ID: {selected_agency}")
-        try:
-            import requests
-            response = requests.get(
-                f"https://input-backend.i14y.c.bfs.admin.ch/api/Agent/{selected_agency}",
-                timeout=5
-            )
-            if response.status_code == 200:
-                agency_details = response.json()
-                logger.info(f"[/upload] Successfully fetched agency details for {agency_details.get('id')}")
-                
-                # If we have contact information from the agency, create an address_data structure
-                if agency_details.get('contactPoint'):
-                    cp = agency_details['contactPoint']
-                    # Only overwrite address_data if it's empty
-                    if not address_data:
-                        address_data = {
-                            'address': cp.get('hasAddress', {}).get('en', ''),
-                            'email': cp.get('hasEmail', ''),
-                            'phone': cp.get('hasTelephone', ''),
-                            'organization': agency_details.get('name', {}).get('en', ''),
-                            'note': cp.get('note', '')
-                        }
-                        session['address_data'] = address_data
-                        logger.info(f"[/upload] Created address_data from agency details")
-        except Exception as e:
-            logger.error(f"[/upload] Error fetching agency details: {str(e)}")
+        logger.info("[/upload] Fetching details for agency ID: %s", selected_agency)
+        agency_details = get_cached_agency_details(selected_agency)
+        if agency_details:
+            logger.info("[/upload] Successfully fetched agency details for %s", agency_details.get('id'))
+            
+            # If we have contact information from the agency, create an address_data structure
+            if agency_details.get('contactPoint'):
+                cp = agency_details['contactPoint']
+                # Only overwrite address_data if it's empty
+                if not address_data:
+                    address_data = {
+                        'address': cp.get('hasAddress', {}).get('en', ''),
+                        'email': cp.get('hasEmail', ''),
+                        'phone': cp.get('hasTelephone', ''),
+                        'organization': agency_details.get('name', {}).get('en', ''),
+                        'note': cp.get('note', '')
+                    }
+                    session['address_data'] = address_data
+                    logger.info("[/upload] Created address_data from agency details")
     
     # Allow editing of all fields
     if request.method == 'POST':
         # Get contact point from session or use default
-        contact_point = session.get('contact_point', default_contact_point.copy())
+        contact_point = session.get('contact_point') or copy.deepcopy(DEFAULT_VCARD_CONTACT_POINT)
         
         # Ensure all required fields exist in the structure
-        if 'fn' not in contact_point or not isinstance(contact_point.get('fn'), dict):
-            contact_point['fn'] = {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-        if 'org' not in contact_point or not isinstance(contact_point.get('org'), dict):
-            contact_point['org'] = {"de": "", "en": "", "fr": "", "it": ""}
-        if 'hasAddress' not in contact_point or not isinstance(contact_point.get('hasAddress'), dict):
-            contact_point['hasAddress'] = {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-        if 'adrWork' not in contact_point or not isinstance(contact_point.get('adrWork'), dict):
-            contact_point['adrWork'] = {"de": "", "en": "", "fr": "", "it": ""}
-        if 'note' not in contact_point or not isinstance(contact_point.get('note'), dict):
-            contact_point['note'] = {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-                
+        ensure_contact_point_fields(contact_point)
+        
         # Validate required fields
         email = request.form.get('emailInternet', '').strip()
         if not email:
@@ -930,81 +1278,20 @@ def upload():
             return redirect(url_for('upload'))
         
         # Save all reviewed content from the form
-        translations['en']['title'] = request.form.get('title_en', '')
-        translations['en']['description'] = request.form.get('description_en', '')
-        translations['en']['keywords'] = [kw.strip() for kw in request.form.get('keywords_en', '').split(',') if kw.strip()]
-        translations['de']['title'] = request.form.get('title_de', '')
-        translations['de']['description'] = request.form.get('description_de', '')
-        translations['de']['keywords'] = [kw.strip() for kw in request.form.get('keywords_de', '').split(',') if kw.strip()]
-        translations['fr']['title'] = request.form.get('title_fr', '')
-        translations['fr']['description'] = request.form.get('description_fr', '')
-        translations['fr']['keywords'] = [kw.strip() for kw in request.form.get('keywords_fr', '').split(',') if kw.strip()]
-        translations['it']['title'] = request.form.get('title_it', '')
-        translations['it']['description'] = request.form.get('description_it', '')
-        translations['it']['keywords'] = [kw.strip() for kw in request.form.get('keywords_it', '').split(',') if kw.strip()]
-        
-        # Contact point fields - save to BOTH fn/org and hasAddress/adrWork for compatibility
-        contact_point['fn']['de'] = request.form.get('org_de', '')
-        contact_point['fn']['en'] = request.form.get('org_en', '')
-        contact_point['fn']['fr'] = request.form.get('org_fr', '')
-        contact_point['fn']['it'] = request.form.get('org_it', '')
-        contact_point['fn']['rm'] = ""
-        # ALSO save to org field (for autosave consistency)
-        contact_point['org']['de'] = request.form.get('org_de', '')
-        contact_point['org']['en'] = request.form.get('org_en', '')
-        contact_point['org']['fr'] = request.form.get('org_fr', '')
-        contact_point['org']['it'] = request.form.get('org_it', '')
-        
-        contact_point['hasAddress']['de'] = request.form.get('adr_de', '')
-        contact_point['hasAddress']['en'] = request.form.get('adr_en', '')
-        contact_point['hasAddress']['fr'] = request.form.get('adr_fr', '')
-        contact_point['hasAddress']['it'] = request.form.get('adr_it', '')
-        contact_point['hasAddress']['rm'] = ""
-        # ALSO save to adrWork field (for autosave consistency)
-        contact_point['adrWork']['de'] = request.form.get('adr_de', '')
-        contact_point['adrWork']['en'] = request.form.get('adr_en', '')
-        contact_point['adrWork']['fr'] = request.form.get('adr_fr', '')
-        contact_point['adrWork']['it'] = request.form.get('adr_it', '')
-        
-        # Save email and phone to BOTH field names (for template AND JSON/API compatibility)
-        email_value = request.form.get('emailInternet', '')
-        contact_point['hasEmail'] = email_value
-        contact_point['emailInternet'] = email_value  # For template display
+        form = request.form
+        translations.update(translations_from_form(form))
         
-        phone_value = request.form.get('telWorkVoice', '')
-        contact_point['hasTelephone'] = phone_value
-        contact_point['telWorkVoice'] = phone_value  # For template display
-        
-        contact_point['note']['de'] = request.form.get('note_de', '')
-        contact_point['note']['en'] = request.form.get('note_en', '')
-        contact_point['note']['fr'] = request.form.get('note_fr', '')
-        contact_point['note']['it'] = request.form.get('note_it', '')
-        contact_point['note']['rm'] = ""
-        contact_point['kind'] = "Organization"
+        # Contact point fields - saved to BOTH fn/org and hasAddress/adrWork for compatibility
+        update_contact_point_from_form(contact_point, form)
 
         # Process document links
-        doc_labels = request.form.getlist('doc_label[]')
-        doc_hrefs = request.form.getlist('doc_href[]')
-        
-        # Rebuild document links
-        document_links = []
-        for i in range(len(doc_labels)):
-            if i < len(doc_hrefs) and doc_hrefs[i].strip():
-                href = doc_hrefs[i].strip()
-                label = doc_labels[i].strip() if i < len(doc_labels) else href.split('/')[-1]
-                doc_type = href.split('.')[-1].lower() if '.' in href else ''
-                
-                document_links.append({
-                    'href': href,
-                    'label': label,
-                    'type': doc_type
-                })
+        document_links = build_document_links(form.getlist('doc_label[]'), form.getlist('doc_href[]'))
         
         # Save back to session
         session['document_links'] = document_links
 
-        # Save translations to file to avoid session size limits
-        save_to_session_file('translations', translations)
+        # Save translations to session
+        session['translations'] = translations
         session['translations_available'] = True
         
         # Save contact point to session
@@ -1014,94 +1301,65 @@ def upload():
         # Re-render the page with updated data
     else:
         # GET request - load contact point from session
-        contact_point = session.get('contact_point', default_contact_point.copy())
+        contact_point = session.get('contact_point') or copy.deepcopy(DEFAULT_VCARD_CONTACT_POINT)
         
         # Ensure backward compatibility with template fields
-        if 'org' not in contact_point:
-            contact_point['org'] = {"de": "", "en": "", "fr": "", "it": ""}
-        if 'adrWork' not in contact_point:
-            contact_point['adrWork'] = {"de": "", "en": "", "fr": "", "it": ""}
+        contact_point.setdefault('org', dict.fromkeys(CONTACT_POINT_LANGS[:4], ""))
+        contact_point.setdefault('adrWork', dict.fromkeys(CONTACT_POINT_LANGS[:4], ""))
         
         # Ensure both email field names exist and are synced
-        if 'emailInternet' not in contact_point:
-            contact_point['emailInternet'] = contact_point.get('hasEmail', '')
-        if 'hasEmail' not in contact_point:
-            contact_point['hasEmail'] = contact_point.get('emailInternet', '')
+        contact_point.setdefault('emailInternet', contact_point.get('hasEmail', ''))
+        contact_point.setdefault('hasEmail', contact_point['emailInternet'])
         
         # Ensure both phone field names exist and are synced
-        if 'telWorkVoice' not in contact_point:
-            contact_point['telWorkVoice'] = contact_point.get('hasTelephone', '')
-        if 'hasTelephone' not in contact_point:
-            contact_point['hasTelephone'] = contact_point.get('telWorkVoice', '')
+        contact_point.setdefault('telWorkVoice', contact_point.get('hasTelephone', ''))
+        contact_point.setdefault('hasTelephone', contact_point['telWorkVoice'])
             
         # Copy from fn to org for compatibility if fn exists
+        org = contact_point['org']
         if 'fn' in contact_point:
-            for lang in ['de', 'en', 'fr', 'it']:
-                if contact_point['fn'].get(lang):
-                    contact_point['org'][lang] = contact_point['fn'].get(lang, '')
+            fn = contact_point['fn']
+            for lang in CONTACT_POINT_LANGS[:4]:
+                if fn.get(lang):
+                    org[lang] = fn[lang]
 
         # --- Prefill contact point fields from address_data if available and fields are empty ---
         if address_data:
             # Prefill email to BOTH field names
             if not contact_point.get('emailInternet') and not contact_point.get('hasEmail'):
-                email_val = address_data.get('email', '')
-                contact_point['emailInternet'] = email_val
-                contact_point['hasEmail'] = email_val
+                contact_point['emailInternet'] = contact_point['hasEmail'] = address_data.get('email', '')
             # Prefill phone to BOTH field names
             if not contact_point.get('telWorkVoice') and not contact_point.get('hasTelephone'):
-                phone_val = address_data.get('phone', '')
-                contact_point['telWorkVoice'] = phone_val
-                contact_point['hasTelephone'] = phone_val
-            
-            # Prefill org name in all languages from agency_details if available
-            if agency_details and agency_details.get('name'):
-                for lang in ['de', 'en', 'fr', 'it']:
-                    if not contact_point['org'].get(lang) and agency_details['name'].get(lang):
-                        contact_point['org'][lang] = agency_details['name'].get(lang, '')
-            # If no agency_details, fall back to single org name from address_data
-            elif address_data.get('organization'):
-                org_name = address_data.get('organization', '')
-                for lang in ['de', 'en', 'fr', 'it']:
-                    if not contact_point['org'].get(lang):
-                        contact_point['org'][lang] = org_name
+                contact_point['telWorkVoice'] = contact_point['hasTelephone'] = address_data.get('phone', '')
             
-            # Prefill address in all languages if available from agency_details
-            if agency_details and agency_details.get('contactPoint') and agency_details['contactPoint'].get('hasAddress'):
-                for lang in ['de', 'en', 'fr', 'it']:
-                    if not contact_point['adrWork'].get(lang) and agency_details['contactPoint']['hasAddress'].get(lang):
-                        contact_point['adrWork'][lang] = agency_details['contactPoint']['hasAddress'].get(lang, '')
-            # Fall back to single address from address_data
-            elif address_data.get('address'):
-                adr = address_data.get('address', '')
-                for lang in ['de', 'en', 'fr', 'it']:
-                    if not contact_point['adrWork'].get(lang):
-                        contact_point['adrWork'][lang] = adr
+            # Prefill org name and address per language from agency_details, falling back to
+            # the single org name / address from address_data
+            agency_names = agency_details.get('name') or {}
+            agency_addresses = (agency_details.get('contactPoint') or {}).get('hasAddress') or {}
+            org_name = address_data.get('organization', '')
+            adr = address_data.get('address', '')
+            adr_work = contact_point['adrWork']
+            for lang in CONTACT_POINT_LANGS[:4]:
+                if not org.get(lang):
+                    org[lang] = agency_names.get(lang) or org_name
+                if not adr_work.get(lang):
+                    adr_work[lang] = agency_addresses.get(lang) or adr
             
             # Prefill note (all languages)
             note = address_data.get('note', '')
             if note:
-                for lang in ['de', 'en', 'fr', 'it']:
-                    if not contact_point['note'].get(lang):
-                        contact_point['note'][lang] = note
+                note_by_lang = contact_point['note']
+                for lang in CONTACT_POINT_LANGS[:4]:
+                    if not note_by_lang.get(lang):
+                        note_by_lang[lang] = note
 
     # Generate the JSON preview
-    from utils.json_utils import generate_dcat_json
     # Use agency identifier if available
     publisher_identifier = agency_details.get('identifier', selected_agency)
-    logger.info(f"[/upload] Using publisher identifier: {publisher_identifier} (from agency_details: {bool(agency_details)}, selected_agency: {selected_agency})")
+    logger.debug("[/upload] Using publisher identifier: %s (from agency_details: %s, selected_agency: %s)",
+                 publisher_identifier, bool(agency_details), selected_agency)
     
-    # Make a copy of contact_point with appropriate structure for json_utils
-    json_contact_point = {
-        "fn": contact_point.get('fn', contact_point.get('org', {})),
-        "org": contact_point.get('org', {}),
-        "hasAddress": contact_point.get('hasAddress', contact_point.get('adrWork', {})),
-        "hasEmail": contact_point.get('hasEmail', contact_point.get('emailInternet', '')),
-        "hasTelephone": contact_point.get('hasTelephone', contact_point.get('telWorkVoice', '')),
-        "kind": "Organization",
-        "note": contact_point.get('note', {})
-    }
-    
-    json_data = generate_dcat_json(
+    json_data = get_cached_dcat_json(
         translations=translations,
         theme_codes=theme_codes,
         agency_id=publisher_identifier,
@@ -1110,33 +1368,24 @@ def upload():
         agents_list=agents,
         access_rights_code=access_rights_code,
         license_code=license_code,
-        contact_point_override=json_contact_point,
+        contact_point_override=contact_point,
         document_links=document_links
     )
-    json_preview = json.dumps(json_data, indent=2)
-
-    # Store the latest JSON in session for download and API submission
-    session['latest_json_data'] = json_data
+    json_preview = orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode('utf-8')
 
     # Render the template with editable fields
-    logger.info(f"[/upload] Rendering template with translations")
+    logger.debug("[/upload] Rendering template with translations")
     
     # Compatibility mapping for template
-    template_contact_point = contact_point.copy()
-    template_contact_point['org'] = {
-        'de': contact_point.get('fn', {}).get('de', ''),
-        'en': contact_point.get('fn', {}).get('en', ''),
-        'fr': contact_point.get('fn', {}).get('fr', ''),
-        'it': contact_point.get('fn', {}).get('it', '')
-    }
-    template_contact_point['adrWork'] = {
-        'de': contact_point.get('hasAddress', {}).get('de', ''),
-        'en': contact_point.get('hasAddress', {}).get('en', ''),
-        'fr': contact_point.get('hasAddress', {}).get('fr', ''),
-        'it': contact_point.get('hasAddress', {}).get('it', '')
+    fn = contact_point.get('fn') or {}
+    has_address = contact_point.get('hasAddress') or {}
+    template_contact_point = {
+        **contact_point,
+        'org': {lang: fn.get(lang, '') for lang in CONTACT_POINT_LANGS[:4]},
+        'adrWork': {lang: has_address.get(lang, '') for lang in CONTACT_POINT_LANGS[:4]},
+        'emailInternet': contact_point.get('hasEmail', ''),
+        'telWorkVoice': contact_point.get('hasTelephone', '')
     }
-    template_contact_point['emailInternet'] = contact_point.get('hasEmail', '')
-    template_contact_point['telWorkVoice'] = contact_point.get('hasTelephone', '')
     
     return render_template('upload.html',
         translations=translations,
@@ -1153,89 +1402,24 @@ def upload():
 
 @app.route('/download_json', methods=['GET', 'POST'])
 def download_json():
-    # Always regenerate JSON from current session data to ensure latest values
-    # (Don't use cached session['latest_json_data'] as it may be stale after autosave)
-    translations = session.get('translations', {})
-    theme_codes = session.get('theme_codes', [])
-    selected_agency = session.get('selected_agency', '')
-    access_rights_code = session.get('access_rights_code', 'PUBLIC')
-    license_code = session.get('license_code', '')
-    agents = get_cached_agents()
-    
-    # Get contact point from session
-    contact_point = session.get('contact_point', {})
-    
-    document_links = session.get('document_links', [])
-    
-    # Fetch agency details to get the correct identifier
-    agency_identifier = selected_agency
-    try:
-        import requests
-        response = requests.get(
-            f"https://input-backend.i14y.c.bfs.admin.ch/api/Agent/{selected_agency}",
-            timeout=5
-        )
-        if response.status_code == 200:
-            agency_details = response.json()
-            agency_identifier = agency_details.get('identifier', selected_agency)
-    except Exception as e:
-        pass
-    
-    # Make a copy of contact_point with appropriate structure for json_utils
-    json_contact_point = {
-        "fn": contact_point.get('fn', contact_point.get('org', {})),
-        "org": contact_point.get('org', {}),
-        "hasAddress": contact_point.get('hasAddress', contact_point.get('adrWork', {})),
-        "hasEmail": contact_point.get('hasEmail', contact_point.get('emailInternet', '')),
-        "hasTelephone": contact_point.get('hasTelephone', contact_point.get('telWorkVoice', '')),
-        "kind": "Organization",
-        "note": contact_point.get('note', {})
-    }
-
-    from utils.json_utils import generate_dcat_json
-    logger.info(f"[download_json] Using publisher (agency_identifier): {agency_identifier} (selected_agency: {selected_agency})")
-    json_data = generate_dcat_json(
-        translations=translations,
-        theme_codes=theme_codes,
-        agency_id=agency_identifier,
-        swagger_url=session.get('swagger_url', ''),
-        landing_page_url=session.get('landing_page_url', ''),
-        agents_list=agents,
-        access_rights_code=access_rights_code,
-        license_code=license_code,
-        contact_point_override=json_contact_point,
-        document_links=document_links
-    )
+    # Always regenerate JSON from current session data to ensure latest values (cached by get_cached_dcat_json)
+    json_data = build_session_dcat_json()
 
     # Wrap the JSON data in a "data" field to match the POST request format
     wrapped_payload = {
         "data": json_data
     }
 
-    # Convert to pretty JSON string
-    import json
-    json_string = json.dumps(wrapped_payload, indent=2)
-
-    # Create a response with the JSON data
-    import io
-    from flask import send_file
-
     # Generate filename based on the API title (from the nested data object)
-    api_title = json_data.get('title', {}).get('en', 'api')
-    filename = f"{api_title.lower().replace(' ', '_')}_dcat.json"
-
-    # Create in-memory file
-    mem = io.BytesIO()
-    mem.write(json_string.encode('utf-8'))
-    mem.seek(0)
-
-    # Send the file as an attachment
-    return send_file(
-        mem,
-        mimetype='application/json',
-        as_attachment=True,
-        download_name=filename
-    )
+    api_title = json_data.get('title', {}).get('en') or 'api'
+    filename = f"{api_title.lower().translate(DOWNLOAD_FILENAME_TABLE)}_dcat.json"
+
+    # Send the serialized JSON as an attachment (ASCII fallback name plus the UTF-8 one, as send_file does)
+    response = Response(orjson.dumps(wrapped_payload, option=orjson.OPT_INDENT_2), mimetype='application/json')
+    ascii_filename = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+    response.headers.set('Content-Disposition', 'attachment',
+                         filename=ascii_filename, **{'filename*': f"UTF-8''{quote(filename)}"})
+    return response
 
 @app.route('/submit_to_i14y', methods=['POST'])
 def submit_to_i14y():
@@ -1243,109 +1427,27 @@ def submit_to_i14y():
     Submit the generated JSON data directly to the I14Y Partner API
     """
     try:
-        # Import session utilities for data restoration
-        from utils.session_utils import restore_all_data_from_files
-        
-        # Ensure all data is restored from persistent storage (Docker reliability)
-        restore_all_data_from_files()
+        # Get the token and email from request - validated before any JSON is built
+        request_data = request.get_json(cache=False, silent=True) or {}
+        token = (request_data.get('token') or '').strip()
+        email = request_data.get('email', '')
         
-        # Use the latest generated JSON from session if available
-        json_data = session.get('latest_json_data')
-        if not json_data:
-            # Fallback: regenerate if not present
-            from utils.session_utils import load_from_session_file
-            
-            # Load data from both session and files (prefer session, fallback to files)
-            translations = session.get('translations', {}) or load_from_session_file('translations', {})
-            theme_codes = session.get('theme_codes', [])
-            selected_agency = session.get('selected_agency', '')
-            swagger_url = session.get('swagger_url', '')
-            landing_page_url = session.get('landing_page_url', '')
-            access_rights_code = session.get('access_rights_code', 'PUBLIC')
-            license_code = session.get('license_code', '')
-            agents = get_cached_agents()
-            default_contact_point = {
-                "emailInternet": "",
-                "org": {"de": "", "en": "", "fr": "", "it": ""},
-                "adrWork": {"de": "", "en": "", "fr": "", "it": ""},
-                "note": {"de": "", "en": "", "fr": "", "it": ""},
-                "telWorkVoice": "",
-                "fn": {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-            }
-            contact_point = session.get('contact_point', default_contact_point)
-            if 'fn' not in contact_point or not isinstance(contact_point['fn'], dict):
-                contact_point['fn'] = {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-            for lang in ["de", "en", "fr", "it", "rm"]:
-                if lang not in contact_point['fn']:
-                    contact_point['fn'][lang] = ""
-            document_links = session.get('document_links', [])
-            
-            # Fetch agency details to get the correct identifier (not GUID)
-            agency_identifier = selected_agency
-            try:
-                import requests
-                response = requests.get(
-                    f"https://input-backend.i14y.c.bfs.admin.ch/api/Agent/{selected_agency}",
-                    timeout=5
-                )
-                if response.status_code == 200:
-                    agency_details = response.json()
-                    agency_identifier = agency_details.get('identifier', selected_agency)
-                    logger.info(f"[submit_to_i14y fallback] Fetched agency identifier: {agency_identifier} from GUID: {selected_agency}")
-            except Exception as e:
-                logger.warning(f"[submit_to_i14y fallback] Could not fetch agency details: {e}")
-            
-            # Make a copy of contact_point with appropriate structure for json_utils
-            json_contact_point = {
-                "fn": contact_point.get('fn', contact_point.get('org', {})),
-                "org": contact_point.get('org', {}),
-                "hasAddress": contact_point.get('hasAddress', contact_point.get('adrWork', {})),
-                "hasEmail": contact_point.get('hasEmail', contact_point.get('emailInternet', '')),
-                "hasTelephone": contact_point.get('hasTelephone', contact_point.get('telWorkVoice', '')),
-                "kind": "Organization",
-                "note": contact_point.get('note', {})
-            }
-            
-            from utils.json_utils import generate_dcat_json
-            json_data = generate_dcat_json(
-                translations=translations,
-                theme_codes=theme_codes,
-                agency_id=agency_identifier,
-                swagger_url=swagger_url,
-                landing_page_url=landing_page_url,
-                agents_list=agents,
-                access_rights_code=access_rights_code,
-                license_code=license_code,
-                contact_point_override=json_contact_point,
-                document_links=document_links
-            )
-
-        # Get the token and email from request
-        request_data = request.get_json()
-        if not request_data or 'token' not in request_data:
+        if not token:
             return jsonify({
                 'success': False, 
                 'error': 'No access token provided.'
             })
         
-        token = request_data['token'].strip()
-        email = request_data.get('email', '')
-        
         # Validate token format
         if not token.lower().startswith('bearer '):
             return jsonify({
                 'success': False, 
                 'error': 'Invalid token format. Token must start with "Bearer ".'
             })
-
+        
         # Get required data from session
         translations = session.get('translations', {})
-        theme_codes = session.get('theme_codes', [])
         selected_agency = session.get('selected_agency', '')
-        swagger_url = session.get('swagger_url', '')
-        landing_page_url = session.get('landing_page_url', '')
-        access_rights_code = session.get('access_rights_code', 'PUBLIC')
-        license_code = session.get('license_code', '')
 
         # Validate required data
         if not translations:
@@ -1360,57 +1462,8 @@ def submit_to_i14y():
                 'error': 'No publisher selected. Please complete step 2.'
             })
 
-        # Get agents for publisher name resolution
-        agents = get_cached_agents()
-
-        # Get contact point from session
-        contact_point = session.get('contact_point', {})
-        
-        # Always get document_links from session
-        document_links = session.get('document_links', [])
-
-        # Fetch agency details to get the correct identifier (not GUID)
-        agency_identifier = selected_agency
-        try:
-            import requests
-            response = requests.get(
-                f"https://input-backend.i14y.c.bfs.admin.ch/api/Agent/{selected_agency}",
-                timeout=5
-            )
-            if response.status_code == 200:
-                agency_details = response.json()
-                agency_identifier = agency_details.get('identifier', selected_agency)
-                logger.info(f"[submit_to_i14y] Fetched agency identifier: {agency_identifier} from GUID: {selected_agency}")
-        except Exception as e:
-            logger.warning(f"[submit_to_i14y] Could not fetch agency details: {e}")
-
-        # Make a copy of contact_point with appropriate structure for json_utils
-        # This matches the approach in download_json to ensure consistency
-        json_contact_point = {
-            "fn": contact_point.get('fn', contact_point.get('org', {})),
-            "org": contact_point.get('org', {}),
-            "hasAddress": contact_point.get('hasAddress', contact_point.get('adrWork', {})),
-            "hasEmail": contact_point.get('hasEmail', contact_point.get('emailInternet', '')),
-            "hasTelephone": contact_point.get('hasTelephone', contact_point.get('telWorkVoice', '')),
-            "kind": "Organization",
-            "note": contact_point.get('note', {})
-        }
-
-        # Generate the JSON data for I14Y
-        from utils.json_utils import generate_dcat_json
-        logger.info(f"[submit_to_i14y] Using publisher identifier: {agency_identifier} (selected_agency GUID: {selected_agency})")
-        json_data = generate_dcat_json(
-            translations=translations,
-            theme_codes=theme_codes,
-            agency_id=agency_identifier,
-            swagger_url=swagger_url,
-            landing_page_url=landing_page_url,
-            agents_list=agents,
-            access_rights_code=access_rights_code,
-            license_code=license_code,
-            contact_point_override=json_contact_point,
-            document_links=document_links
-        )
+        # Generate the JSON data for I14Y from the current session data
+        json_data = build_session_dcat_json()
         
         # Submit to I14Y API
         try:
@@ -1484,11 +1537,11 @@ def submit_data_to_i14y_api(json_data, token):
         logger.debug(f"[submit_data_to_i14y_api] Payload prepared for submission")
         
         # Make the API request with timeout
-        response = requests.post(
+        response = i14y_http_session.post(
             api_endpoint,
-            json=wrapped_payload,
+            data=orjson.dumps(wrapped_payload),
             headers=headers,
-            timeout=30  # 30 second timeout
+            timeout=(5, 30)  # 5 second connect, 30 second read timeout
         )
         
         # Check if request was successful
@@ -1498,8 +1551,7 @@ def submit_data_to_i14y_api(json_data, token):
                 response_text = response.text.strip().strip('"')
                 
                 # Check if response looks like a UUID (basic validation)
-                uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
-                if uuid_pattern.match(response_text):
+                if UUID_RE.match(response_text):
                     # It's a valid UUID
                     return {
                         'success': True,
@@ -1507,14 +1559,14 @@ def submit_data_to_i14y_api(json_data, token):
                     }
                     
                 # Fallback to parsing as JSON if it's not a plain UUID string
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
                 dataset_id = response_data.get('id') or response_data.get('datasetId') or 'Generated'
                 return {
                     'success': True,
                     'dataset_id': dataset_id,
                     'response': response_data
                 }
-            except json.JSONDecodeError:
+            except ValueError:
                 # If it's not valid JSON but the status is success, use the response text as dataset_id
                 # This handles the case where the API returns just the UUID as plain text
                 return {
@@ -1523,74 +1575,20 @@ def submit_data_to_i14y_api(json_data, token):
                     'response': response.text
                 }
         
-        # Handle different error status codes
-        elif response.status_code == 401:
-            return {
-                'success': False,
-                'error': 'Authentication failed. Please check your access token.'
-            }
-        elif response.status_code == 403:
-            return {
-                'success': False,
-                'error': 'Access forbidden. You may not have permission to submit data.'
-            }
-        elif response.status_code == 400:
+        # Log detailed error info for debugging but don't expose it to the user
+        if response.status_code not in (401, 403):
             try:
-                error_data = response.json()
-                error_msg = error_data.get('message') or error_data.get('error') or 'Bad request'
-                
-                # Log detailed error info for debugging but don't expose to user
-                logger.error(f"I14Y Partner API Bad Request (400): {error_msg}")
-                logger.error(f"Full error response: {json.dumps(error_data, indent=2)}")
-                
-                return {
-                    'success': False,
-                    'error': 'Bad request. Please verify your data format and try again.'
-                }
-            except json.JSONDecodeError:
-                logger.error(f"I14Y API error (400): {response.text}")
-                return {
-                    'success': False,
-                    'error': 'Bad request. Please verify your data format and try again.'
-                }
-        elif response.status_code == 422:
-            try:
-                error_data = response.json()
-                error_msg = error_data.get('message') or error_data.get('error') or 'Validation failed'
-                
-                # Log detailed validation errors for debugging but don't expose to user
-                logger.error(f"I14Y Partner API Validation Error (422): {error_msg}")
-                logger.error(f"Full validation error: {json.dumps(error_data, indent=2)}")
-                
-                return {
-                    'success': False,
-                    'error': 'Data validation failed. Please check all required fields and try again.'
-                }
-            except json.JSONDecodeError:
-                logger.error(f"I14Y API validation error (422): {response.text}")
-                return {
-                    'success': False,
-                    'error': 'Data validation failed. Please check all required fields and try again.'
-                }
-        else:
-            try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_msg = error_data.get('message') or error_data.get('error') or f'HTTP {response.status_code}'
-                
-                # Log detailed error info for debugging but don't expose to user
                 logger.error(f"I14Y Partner API Error (HTTP {response.status_code}): {error_msg}")
-                logger.error(f"Full error response: {json.dumps(error_data, indent=2)}")
-                
-                return {
-                    'success': False,
-                    'error': f'API request failed. Please try again later.'
-                }
-            except json.JSONDecodeError:
-                logger.error(f"I14Y API error (HTTP {response.status_code}): {response.text}")
-                return {
-                    'success': False,
-                    'error': f'API request failed. Please try again later.'
-                }
+                logger.error(f"Full error response: {orjson.dumps(error_data, option=orjson.OPT_INDENT_2).decode('utf-8')}")
+            except ValueError:
+                logger.error(f"I14Y API error (HTTP {response.status_code}): {response.text[:I14Y_ERROR_TEXT_LIMIT]}")
+        
+        return {
+            'success': False,
+            'error': I14Y_ERROR_MESSAGES.get(response.status_code, I14Y_DEFAULT_ERROR_MESSAGE)
+        }
     except requests.exceptions.Timeout:
         return {
             'success': False,
@@ -1620,57 +1618,28 @@ def submit_data_to_i14y_api(json_data, token):
 def debug_i14y_json():
     """Debug endpoint to view the exact JSON that would be sent to I14Y Partner API"""
     try:
-        # Import session utilities for data restoration
-        from utils.session_utils import restore_all_data_from_files
-        
-        # Ensure all data is restored from persistent storage
-        restore_all_data_from_files()
-        
         # Load required data
-        from utils.session_utils import load_from_session_file
-        translations = session.get('translations', {}) or load_from_session_file('translations', {})
+        translations = session.get('translations', {})
         theme_codes = session.get('theme_codes', [])
         selected_agency = session.get('selected_agency', '')
         swagger_url = session.get('swagger_url', '')
         landing_page_url = session.get('landing_page_url', '')
         access_rights_code = session.get('access_rights_code', 'PUBLIC')
         license_code = session.get('license_code', '')
-        access_rights_code = session.get('access_rights_code', 'PUBLIC')
-        license_code = session.get('license_code', '')
         agents = get_cached_agents()
         
         # Get contact point data
-        default_contact_point = {
-            "emailInternet": "",
-            "org": {"de": "", "en": "", "fr": "", "it": ""},
-            "adrWork": {"de": "", "en": "", "fr": "", "it": ""},
-            "note": {"de": "", "en": "", "fr": "", "it": ""},
-            "telWorkVoice": ""
-        }
-        contact_point = session.get('contact_point', default_contact_point)
-        # Remove fn field if present
-        if 'fn' in contact_point:
-            del contact_point['fn']
+        # Remove fn field if present (on a copy - the session dict must not change)
+        contact_point = {key: value for key, value in (session.get('contact_point') or DEFAULT_CONTACT_POINT).items()
+                         if key != 'fn'}
             
         document_links = session.get('document_links', [])
         
         # Fetch agency details to get the correct identifier
-        agency_identifier = selected_agency
-        try:
-            import requests
-            response = requests.get(
-                f"https://input-backend.i14y.c.bfs.admin.ch/api/Agent/{selected_agency}",
-                timeout=5
-            )
-            if response.status_code == 200:
-                agency_details = response.json()
-                agency_identifier = agency_details.get('identifier', selected_agency)
-        except Exception as e:
-            pass
+        agency_identifier = get_cached_agency_details(selected_agency).get('identifier', selected_agency)
         
         # Generate the JSON
-        from utils.json_utils import generate_dcat_json
-        json_data = generate_dcat_json(
+        json_data = get_cached_dcat_json(
             translations=translations,
             theme_codes=theme_codes,
             agency_id=agency_identifier,
@@ -1716,17 +1685,15 @@ def debug_i14y_json():
             "data": json_data
         }
             
-        # Create response with pretty-printed JSON for browser viewing
         response_data = {
             'json_data': json_data,
             'wrapped_payload': wrapped_payload,
-            'validation_notes': validation_notes,
-            'pretty_json': json.dumps(json_data, indent=2, ensure_ascii=False),
-            'pretty_wrapped_payload': json.dumps(wrapped_payload, indent=2, ensure_ascii=False)
+            'validation_notes': validation_notes
         }
         
-        # Return the JSON for inspection
-        return jsonify(response_data)
+        # Return the JSON for inspection, serialized once and pretty-printed for browser viewing
+        return Response(orjson.dumps(response_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS),
+                        mimetype='application/json')
     except Exception as e:
         logger.error(f"Error generating preview JSON: {str(e)}")
         logger.error("Preview generation error", exc_info=True)
@@ -1740,85 +1707,28 @@ def autosave_review():
     Autosave reviewed content from the upload (step 4) form via AJAX.
     """
     # Get translations from session or initialize
-    from utils.session_utils import save_to_session_file, load_from_session_file
-
-    translations = load_from_session_file('translations', {}) or session.get('translations', {})
-    default_contact_point = {
-        "emailInternet": "",
-        "org": {"de": "", "en": "", "fr": "", "it": ""},
-        "adrWork": {"de": "", "en": "", "fr": "", "it": ""},
-        "note": {"de": "", "en": "", "fr": "", "it": ""},
-        "telWorkVoice": "",
-        "fn": {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-    }
-    contact_point = session.get('contact_point', default_contact_point)
+    translations = session.get('translations', {})
+    contact_point = session.get('contact_point') or copy.deepcopy(DEFAULT_CONTACT_POINT)
+
+    form = request.form
 
     # Update translations
-    translations['en']['title'] = request.form.get('title_en', '')
-    translations['en']['description'] = request.form.get('description_en', '')
-    translations['en']['keywords'] = [kw.strip() for kw in request.form.get('keywords_en', '').split(',') if kw.strip()]
-    translations['de']['title'] = request.form.get('title_de', '')
-    translations['de']['description'] = request.form.get('description_de', '')
-    translations['de']['keywords'] = [kw.strip() for kw in request.form.get('keywords_de', '').split(',') if kw.strip()]
-    translations['fr']['title'] = request.form.get('title_fr', '')
-    translations['fr']['description'] = request.form.get('description_fr', '')
-    translations['fr']['keywords'] = [kw.strip() for kw in request.form.get('keywords_fr', '').split(',') if kw.strip()]
-    translations['it']['title'] = request.form.get('title_it', '')
-    translations['it']['description'] = request.form.get('description_it', '')
-    translations['it']['keywords'] = [kw.strip() for kw in request.form.get('keywords_it', '').split(',') if kw.strip()]
-
-    # Update contact point
-    contact_point['org']['de'] = request.form.get('org_de', '')
-    contact_point['org']['en'] = request.form.get('org_en', '')
-    contact_point['org']['fr'] = request.form.get('org_fr', '')
-    contact_point['org']['it'] = request.form.get('org_it', '')
-    contact_point['adrWork']['de'] = request.form.get('adr_de', '')
-    contact_point['adrWork']['en'] = request.form.get('adr_en', '')
-    contact_point['adrWork']['fr'] = request.form.get('adr_fr', '')
-    contact_point['adrWork']['it'] = request.form.get('adr_it', '')
-    
-    # Save email to BOTH emailInternet (for template) AND hasEmail (for JSON/API)
-    email_value = request.form.get('emailInternet', '')
-    contact_point['emailInternet'] = email_value
-    contact_point['hasEmail'] = email_value
-    
-    # Save phone to BOTH telWorkVoice (for template) AND hasTelephone (for JSON/API)
-    phone_value = request.form.get('telWorkVoice', '')
-    contact_point['telWorkVoice'] = phone_value
-    contact_point['hasTelephone'] = phone_value
-    
-    contact_point['note']['de'] = request.form.get('note_de', '')
-    contact_point['note']['en'] = request.form.get('note_en', '')
-    contact_point['note']['fr'] = request.form.get('note_fr', '')
-    contact_point['note']['it'] = request.form.get('note_it', '')
-    if 'fn' not in contact_point or not isinstance(contact_point['fn'], dict):
-        contact_point['fn'] = {"de": "", "en": "", "fr": "", "it": "", "rm": ""}
-    for lang in ["de", "en", "fr", "it", "rm"]:
-        if lang not in contact_point['fn']:
-            contact_point['fn'][lang] = ""
+    translations.update(translations_from_form(form))
+
+    # Update contact point - same fields as the review form submission in upload()
+    ensure_contact_point_fields(contact_point)
+    update_contact_point_from_form(contact_point, form)
 
     # Update document links
-    doc_labels = request.form.getlist('doc_label[]')
-    doc_hrefs = request.form.getlist('doc_href[]')
-    document_links = []
-    for i in range(len(doc_labels)):
-        if i < len(doc_hrefs) and doc_hrefs[i].strip():
-            href = doc_hrefs[i].strip()
-            label = doc_labels[i].strip() if i < len(doc_labels) else href.split('/')[-1]
-            doc_type = href.split('.')[-1].lower() if '.' in href else ''
-            document_links.append({
-                'href': href,
-                'label': label,
-                'type': doc_type
-            })
-    session['document_links'] = document_links
+    document_links = build_document_links(form.getlist('doc_label[]'), form.getlist('doc_href[]'))
 
-    # Save to session and file
+    # Save to session
+    session['document_links'] = document_links
     session['translations'] = translations
-    save_to_session_file('translations', translations)
     session['contact_point'] = contact_point
 
-    return jsonify({"success": True})
+    # The autosave request ignores the response body
+    return '', 204
 
 @app.route('/save_api_details', methods=['POST'])
 def save_api_details():
@@ -1826,8 +1736,6 @@ def save_api_details():
     Save API details from either the AI form or the translation step.
     Detects which form was submitted based on the presence of specific fields.
     """
-    from utils.session_utils import save_to_session_file, load_from_session_file
-
     # Check if this is from the AI form
     is_ai_form = 'title' in request.form and 'title_en' not in request.form
 
@@ -1841,7 +1749,7 @@ def save_api_details():
         
         # Handle keywords
         keywords_str = request.form.get('keywords', '')
-        keywords = [kw.strip() for kw in keywords_str.split(',') if kw.strip()]
+        keywords = split_keywords(keywords_str)
         session['keywords'] = keywords
         
         # Handle theme codes (multi-select)
@@ -1854,29 +1762,8 @@ def save_api_details():
         
         # Save selected agency
         session['selected_agency'] = request.form.get('agency', '')
-        
-        # Save API details to persistent file storage for Docker reliability
-        api_details = {
-            'title': session['title'],
-            'description': session['description'],
-            'keywords': session['keywords'],
-            'theme_codes': session['theme_codes'],
-            'access_rights_code': session['access_rights_code'],
-            'license_code': session['license_code'],
-            'selected_agency': session['selected_agency']
-        }
-        save_to_session_file('api_details', api_details)
-        
-        # Also save the current state with generated content for extra safety
-        if session.get('generated_title') or session.get('generated_description'):
-            generated_data = {
-                'generated_title': session.get('generated_title', ''),
-                'generated_description': session.get('generated_description', ''),
-                'generated_keywords': session.get('generated_keywords', []),
-                'theme_codes': session.get('theme_codes', [])
-            }
-            save_to_session_file('generated_content', generated_data)
-            logger.info("Also saved generated content as backup during API details save")
+        # Overlap the agency details fetch for the review page with the translations below
+        prefetch_agency_details(session['selected_agency'])
         
         logger.info(f"Saved API details: title='{session['title'][:50]}...', keywords={len(keywords)}, themes={len(theme_codes)}, agency='{session['selected_agency']}'")
         
@@ -1898,16 +1785,20 @@ def save_api_details():
         }
         
         # Auto-translate if DeepL is available
-        try:
-            from utils.deepl_utils import translate_to_language
-            
+        if translate_to_language is None:
+            logger.info("DeepL translation not available - using empty translations")
+        else:
             logger.info(f"Starting auto-translation for title='{title[:50]}...', desc_len={len(description)}, keywords={keywords}")
             
-            # Try to translate to German, French, and Italian
-            for target_lang in ['de', 'fr', 'it']:
+            # Try to translate to German, French, and Italian - the DeepL round-trips run in parallel
+            translation_futures = {
+                target_lang: fetch_executor.submit(translate_to_language, title, description, keywords, target_lang)
+                for target_lang in ('de', 'fr', 'it')
+            }
+            for target_lang, future in translation_futures.items():
                 try:
-                    logger.info(f"Attempting translation to {target_lang}")
-                    translated = translate_to_language(title, description, keywords, target_lang)
+                    logger.info(f"Waiting for translation to {target_lang}")
+                    translated = future.result()
                     logger.info(f"Translation result for {target_lang}: {translated}")
                     
                     if translated and not translated.get('error'):
@@ -1921,31 +1812,17 @@ def save_api_details():
                         logger.warning(f"Translation to {target_lang} failed: {translated.get('error', 'Unknown error')}")
                 except Exception as e:
                     logger.warning(f"Translation to {target_lang} failed: {str(e)}")
-        except ImportError:
-            logger.info("DeepL translation not available - using empty translations")
-        except Exception as e:
-            logger.warning(f"Auto-translation failed: {str(e)}")
         
-        # Save translations to persistent storage
+        # Save translations to session
         session['translations'] = translations
-        save_to_session_file('translations', translations)
         session['translations_available'] = True
         
         # Debug logging for translations
         logger.info("Auto-generated translations and proceeding to review")
         logger.info(f"Translations structure created with {len(translations)} languages")
-        logger.info(f"Session ID: {session.get('_id', 'NO_ID')}")
         for lang, content in translations.items():
             logger.info(f"  {lang}: title='{content.get('title', '')[:50]}...', desc_len={len(content.get('description', ''))}, keywords_count={len(content.get('keywords', []))}")
         
-        # Verify file save worked
-        saved_translations = load_from_session_file('translations', {})
-        if saved_translations:
-            logger.info("Verified: translations successfully saved to file")
-            logger.info(f"Loaded back: {len(saved_translations)} languages")
-        else:
-            logger.error("ERROR: translations NOT saved to file!")
-        
     # Redirect directly to upload/review step
     return redirect(url_for('upload'))
 
@@ -134,19 +134,20 @@ def _load_agents_from_cache(ignore_expiry=False):
         # Create cache directory if it doesn't exist
         os.makedirs(CACHE_DIR, exist_ok=True)
         
-        # Check if cache file exists
-        if not os.path.exists(AGENTS_CACHE_FILE):
+        # Check if cache file exists (a single stat gives us the mtime as well)
+        try:
+            cache_stat = os.stat(AGENTS_CACHE_FILE)
+        except FileNotFoundError:
             return None
         
         # Check if cache is expired (unless we're ignoring expiry)
         if not ignore_expiry:
-            cache_mtime = os.path.getmtime(AGENTS_CACHE_FILE)
-            if time.time() - cache_mtime > CACHE_EXPIRY:
+            if time.time() - cache_stat.st_mtime > CACHE_EXPIRY:
                 return None
         
-        # Load and return cached data
+        # Load and return cached data (one read, then decode in memory)
         with open(AGENTS_CACHE_FILE, 'rb') as f:
-            return pickle.load(f)
+            return pickle.loads(f.read())
     
     except Exception as e:
         # If any error occurs, return None to indicate cache miss
@@ -165,7 +166,7 @@ def _save_agents_to_cache(agents_data):
         
         # Save data to cache file
         with open(AGENTS_CACHE_FILE, 'wb') as f:
-            pickle.dump(agents_data, f)
+            pickle.dump(agents_data, f, protocol=pickle.HIGHEST_PROTOCOL)
         
         logger.info(f"Saved {len(agents_data)} agents to cache")
     
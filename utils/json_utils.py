@@ -64,7 +64,7 @@ def get_contact_points_from_agent(agency_id, agents_list):
             "it": "",
             "rm": ""
         },
-        "hasEmail": "info@example.com",  # Required field for VCardModel
+        "hasEmail": "",  # Required field for VCardModel - filled from the agent; never a placeholder address
         "hasTelephone": "",
         "kind": "Organization",  # Required field for VCardModel
         "note": {
@@ -174,7 +174,11 @@ def generate_dcat_json(
     publisher_name = get_publisher_name_from_agents(agency_id, agents_list)
     
     # Get contact points from the selected agency or override
-    contact_point = contact_point_override if contact_point_override else get_contact_points_from_agent(agency_id, agents_list)
+    # (the override may use the review form's field names: org, adrWork, emailInternet, telWorkVoice)
+    if contact_point_override is not None:
+        contact_point = contact_point_override
+    else:
+        contact_point = get_contact_points_from_agent(agency_id, agents_list)
 
     # Helper for multilingual label
     def multi_label(label_de, label_en, label_fr, label_it):
@@ -250,7 +254,7 @@ def generate_dcat_json(
             },
             
             # Email is required
-            "hasEmail": contact_point.get("hasEmail", "info@example.com") if isinstance(contact_point, dict) else "info@example.com",
+            "hasEmail": contact_point.get("hasEmail", contact_point.get("emailInternet", "")) if isinstance(contact_point, dict) else "",
             
             # Telephone information (hasTelephone field as per I14Y spec)
             "hasTelephone": (contact_point.get("hasTelephone") or 
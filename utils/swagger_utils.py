@@ -268,6 +268,13 @@ def resolve_swagger_url(input_url, timeout=10):
             'error': 'Failed to resolve API specification URL'
         }
 
+def format_endpoint_details(endpoint_short_descriptions, limit=30):
+    """Format up to limit endpoint short descriptions as 'METHOD path: description' lines"""
+    lines = [f"{ep['method']} {ep['path']}: {ep['short_description']}" for ep in endpoint_short_descriptions[:limit]]
+    if len(endpoint_short_descriptions) > limit:
+        lines.append(f"... and {len(endpoint_short_descriptions) - limit} more endpoints")
+    return "\n".join(lines)
+
 def extract_swagger_info(swagger_url, timeout=10):
     """
     Extract relevant information from Swagger/OpenAPI specification
@@ -402,6 +409,8 @@ def extract_swagger_info(swagger_url, timeout=10):
             'url_detected': url_resolution.get('detected', False),
             'direct_json': url_resolution.get('direct_json', False),
             'endpoint_short_descriptions': endpoint_short_descriptions,
+            # Preformatted once here so /ai doesn't format the endpoints on every render
+            'endpoint_details_text': format_endpoint_details(endpoint_short_descriptions),
             'processing_time': round(total_time, 2)
         }
         